@@ -0,0 +1,39 @@
+"""add indexer cursors
+
+Revision ID: 5a0d7c2e9b64
+Revises: b7d24e9c1a55
+Create Date: 2025-12-12 10:42:17.305128
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5a0d7c2e9b64'
+down_revision: Union[str, Sequence[str], None] = 'b7d24e9c1a55'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    One row per polled program holding the newest indexed signature, so a
+    restarted indexer resumes from it instead of re-walking recent history.
+    """
+    op.create_table(
+        'indexer_cursors',
+        sa.Column('program', sa.String(length=20), nullable=False),
+        sa.Column('last_signature', sa.String(length=88), nullable=False),
+        sa.Column('slot', sa.BigInteger(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('program'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('indexer_cursors')
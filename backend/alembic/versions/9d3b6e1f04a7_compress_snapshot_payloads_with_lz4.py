@@ -0,0 +1,47 @@
+"""compress snapshot payloads with lz4
+
+Revision ID: 9d3b6e1f04a7
+Revises: 5a0d7c2e9b64
+Create Date: 2025-12-12 14:08:51.672390
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d3b6e1f04a7'
+down_revision: Union[str, Sequence[str], None] = '5a0d7c2e9b64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Large JSONB payloads that are always read whole
+COMPRESSED_COLUMNS = {
+    'captable_snapshots_v2': (
+        'token_state', 'holders', 'share_positions', 'vesting_schedules', 'share_classes',
+    ),
+    'state_changes': ('old_state', 'new_state'),
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    TOAST these columns with lz4 instead of the default pglz: faster to
+    compress and decompress at a similar ratio. Only newly written values are
+    affected. The history tables are created by init_db, hence IF EXISTS;
+    when they don't exist yet, app.models.history applies lz4 as init_db
+    creates them.
+    """
+    for table, columns in COMPRESSED_COLUMNS.items():
+        alters = ', '.join(f'ALTER COLUMN {column} SET COMPRESSION lz4' for column in columns)
+        op.execute(f'ALTER TABLE IF EXISTS {table} {alters}')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, columns in COMPRESSED_COLUMNS.items():
+        alters = ', '.join(f'ALTER COLUMN {column} SET COMPRESSION pglz' for column in columns)
+        op.execute(f'ALTER TABLE IF EXISTS {table} {alters}')
@@ -0,0 +1,84 @@
+"""store vesting interval as smallint
+
+Revision ID: b7d24e9c1a55
+Revises: f81c49d664de
+Create Date: 2025-12-11 17:42:09.583114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d24e9c1a55'
+down_revision: Union[str, Sequence[str], None] = 'f81c49d664de'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    Convert vesting_schedules.interval from VARCHAR(10) to a SMALLINT code
+    (0=minute, 1=hour, 2=day, 3=month), matching VestingIntervalType.
+    Unknown values fall back to minute, as the model already did.
+
+    The 'minute' server default can't be cast automatically, so it is
+    dropped before the type change and re-added as 0 after.
+    """
+    op.alter_column(
+        'vesting_schedules',
+        'interval',
+        existing_type=sa.String(10),
+        existing_nullable=False,
+        server_default=None,
+    )
+    op.alter_column(
+        'vesting_schedules',
+        'interval',
+        existing_type=sa.String(10),
+        type_=sa.SmallInteger(),
+        existing_nullable=False,
+        postgresql_using=(
+            "CASE \"interval\" WHEN 'hour' THEN 1 WHEN 'day' THEN 2 "
+            "WHEN 'month' THEN 3 ELSE 0 END"
+        ),
+    )
+    op.alter_column(
+        'vesting_schedules',
+        'interval',
+        existing_type=sa.SmallInteger(),
+        existing_nullable=False,
+        server_default=sa.text('0'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        'vesting_schedules',
+        'interval',
+        existing_type=sa.SmallInteger(),
+        existing_nullable=False,
+        server_default=None,
+    )
+    op.alter_column(
+        'vesting_schedules',
+        'interval',
+        existing_type=sa.SmallInteger(),
+        type_=sa.String(10),
+        existing_nullable=False,
+        postgresql_using=(
+            "CASE \"interval\" WHEN 1 THEN 'hour' WHEN 2 THEN 'day' "
+            "WHEN 3 THEN 'month' ELSE 'minute' END"
+        ),
+    )
+    op.alter_column(
+        'vesting_schedules',
+        'interval',
+        existing_type=sa.String(10),
+        existing_nullable=False,
+        server_default=sa.text("'minute'::character varying"),
+    )
@@ -0,0 +1,22 @@
+"""Shared response classes"""
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib encoder"""
+
+    def render(self, content: Any) -> bytes:
+        try:
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            # Integers wider than 64 bits (e.g. u128 amounts)
+            return super().render(content)
+
+
+def model_json_response(model: BaseModel) -> Response:
+    """Serialize a response model in pydantic-core, skipping FastAPI's re-encoding"""
+    return Response(model.model_dump_json(), media_type="application/json")
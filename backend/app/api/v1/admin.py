@@ -53,7 +53,7 @@ async def get_multisig_config(token_id: int = Path(...), db: AsyncSession = Depe
         multisig_pda, _ = solana_client.derive_multisig_pda(Pubkey.from_string(token.mint_address))
 
         # Fetch multisig account from chain
-        account_info = await solana_client.get_account_info(multisig_pda)
+        account_info = await solana_client.account_loader.load(multisig_pda)
 
         if not account_info:
             # Multisig not initialized for this token
@@ -9,6 +9,7 @@ import io
 import csv
 import json
 
+from app.api.responses import model_json_response
 from app.models.database import get_db
 from app.models.token import Token
 from app.models.wallet import Wallet
@@ -24,6 +25,7 @@ from app.schemas.captable import (
     EnhancedCapTableByWalletResponse,
     ShareClassSummary,
     WalletSummary,
+    HOLDERS_ADAPTER,
 )
 from app.models.share_class import ShareClass, SharePosition
 from app.models.unified_transaction import UnifiedTransaction, TransactionType
@@ -105,7 +107,7 @@ async def _build_captable(
                 ownership_pct=entry["ownership_pct"],
                 vested=entry.get("vested", 0),
                 unvested=entry.get("unvested", 0),
-                lockout_until=entry.get("lockout_until"),
+                lockout_until=datetime.fromisoformat(entry["lockout_until"]) if entry.get("lockout_until") else None,
                 daily_limit=entry.get("daily_limit"),
                 status=entry.get("status", "active"),
             ))
@@ -235,13 +237,13 @@ async def _build_captable(
 @router.get("", response_model=CapTableResponse)
 async def get_captable(token_id: int = Path(...), db: AsyncSession = Depends(get_db)):
     """Get current cap-table"""
-    return await _build_captable(token_id, db)
+    return model_json_response(await _build_captable(token_id, db))
 
 
 @router.get("/at/{slot}", response_model=CapTableResponse)
 async def get_captable_at_slot(token_id: int = Path(...), slot: int = Path(...), db: AsyncSession = Depends(get_db)):
     """Get cap-table at a specific slot"""
-    return await _build_captable(token_id, db, slot)
+    return model_json_response(await _build_captable(token_id, db, slot))
 
 
 @router.get("/export")
@@ -290,19 +292,7 @@ async def export_captable(
             "timestamp": captable.timestamp.isoformat(),
             "total_supply": captable.total_supply,
             "holder_count": captable.holder_count,
-            "holders": [
-                {
-                    "wallet": h.wallet,
-                    "balance": h.balance,
-                    "ownership_pct": h.ownership_pct,
-                    "vested": h.vested,
-                    "unvested": h.unvested,
-                    "lockout_until": h.lockout_until.isoformat() if h.lockout_until else None,
-                    "daily_limit": h.daily_limit,
-                    "status": h.status,
-                }
-                for h in captable.holders
-            ]
+            "holders": HOLDERS_ADAPTER.dump_python(captable.holders, mode="json"),
         }
 
         content = json.dumps(data, indent=2)
@@ -417,12 +407,18 @@ async def get_enhanced_captable(
     price_per_share = current_valuation // total_shares if total_shares > 0 else 0
     total_current_value = total_shares * price_per_share
 
+    # Aggregate shares and holders per class in a single pass
+    shares_per_class = {}
+    wallets_per_class = {}
+    for p in positions_data:
+        class_id = p['share_class_id']
+        shares_per_class[class_id] = shares_per_class.get(class_id, 0) + p['shares']
+        wallets_per_class.setdefault(class_id, set()).add(p['wallet'])
+
     # Build share class summaries
     class_summaries = []
     for sc in share_classes:
-        class_positions = [p for p in positions_data if p['share_class_id'] == sc.id]
-        class_shares = sum(p['shares'] for p in class_positions)
-        class_value = class_shares * price_per_share
+        class_shares = shares_per_class.get(sc.id, 0)
         class_summaries.append(ShareClassSummary(
             id=sc.id,
             name=sc.name,
@@ -430,17 +426,10 @@ async def get_enhanced_captable(
             priority=sc.priority,
             preference_multiple=sc.preference_multiple,
             total_shares=class_shares,
-            total_value=class_value,
-            holder_count=len(set(p['wallet'] for p in class_positions)),
+            total_value=class_shares * price_per_share,
+            holder_count=len(wallets_per_class.get(sc.id, ())),
         ))
 
-    # Calculate shares per class for class ownership calculation
-    shares_per_class = {}
-    for p in positions_data:
-        if p['share_class_id'] not in shares_per_class:
-            shares_per_class[p['share_class_id']] = 0
-        shares_per_class[p['share_class_id']] += p['shares']
-
     # Build position entries
     position_entries = []
     unique_wallets = set()
@@ -471,7 +460,7 @@ async def get_enhanced_captable(
     # Sort by ownership descending
     position_entries.sort(key=lambda x: x.shares, reverse=True)
 
-    return EnhancedCapTableResponse(
+    return model_json_response(EnhancedCapTableResponse(
         slot=target_slot,
         timestamp=datetime.utcnow(),
         current_valuation=current_valuation,
@@ -483,7 +472,7 @@ async def get_enhanced_captable(
         holder_count=len(unique_wallets),
         share_classes=class_summaries,
         positions=position_entries,
-    )
+    ))
 
 
 @router.get("/enhanced/by-wallet", response_model=EnhancedCapTableByWalletResponse)
@@ -535,19 +524,12 @@ async def get_enhanced_captable_by_wallet(
     total_shares = sum(p.shares for p in positions)
     price_per_share = current_valuation // total_shares if total_shares > 0 else 0
 
-    # Calculate shares per class for class ownership
+    # Calculate shares per class and group positions by wallet in a single pass
     shares_per_class = {}
-    for p in positions:
-        if p.share_class_id not in shares_per_class:
-            shares_per_class[p.share_class_id] = 0
-        shares_per_class[p.share_class_id] += p.shares
-
-    # Group positions by wallet
     wallet_positions = {}
     for p in positions:
-        if p.wallet not in wallet_positions:
-            wallet_positions[p.wallet] = []
-        wallet_positions[p.wallet].append(p)
+        shares_per_class[p.share_class_id] = shares_per_class.get(p.share_class_id, 0) + p.shares
+        wallet_positions.setdefault(p.wallet, []).append(p)
 
     # Build wallet summaries
     wallet_summaries = []
@@ -594,7 +576,7 @@ async def get_enhanced_captable_by_wallet(
     # Sort by ownership descending
     wallet_summaries.sort(key=lambda x: x.total_shares, reverse=True)
 
-    return EnhancedCapTableByWalletResponse(
+    return model_json_response(EnhancedCapTableByWalletResponse(
         slot=current_slot,
         timestamp=datetime.utcnow(),
         current_valuation=current_valuation,
@@ -602,7 +584,7 @@ async def get_enhanced_captable_by_wallet(
         total_shares=total_shares,
         holder_count=len(wallet_summaries),
         wallets=wallet_summaries,
-    )
+    ))
 
 
 # ==================== V2 Snapshot Endpoints ====================
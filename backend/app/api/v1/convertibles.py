@@ -90,7 +90,8 @@ async def create_convertible(
             )
 
     # Validate interest rate for notes
-    if request.instrument_type.value == "convertible_note":
+    is_note = request.instrument_type == "convertible_note"
+    if is_note:
         if request.interest_rate is not None and request.interest_rate < 0:
             raise HTTPException(status_code=400, detail="Interest rate must be non-negative")
 
@@ -100,16 +101,16 @@ async def create_convertible(
 
     convertible = ConvertibleInstrument(
         token_id=token_id,
-        instrument_type=request.instrument_type.value,
+        instrument_type=request.instrument_type,
         name=request.name,
         holder_wallet=request.holder_wallet,
         holder_name=request.holder_name,
         principal_amount=request.principal_amount,
         valuation_cap=request.valuation_cap,
         discount_rate=request.discount_rate,
-        interest_rate=request.interest_rate,
-        maturity_date=request.maturity_date,
-        safe_type=request.safe_type.value if request.safe_type else None,
+        interest_rate=request.interest_rate if is_note else None,
+        maturity_date=request.maturity_date if is_note else None,
+        safe_type=None if is_note else request.safe_type,
         notes=request.notes,
         status="outstanding",
     )
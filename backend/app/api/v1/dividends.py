@@ -1,5 +1,5 @@
 """Dividends API endpoints - Auto-distribution model"""
-from fastapi import APIRouter, Depends, HTTPException, Path
+from fastapi import APIRouter, Depends, HTTPException, Path, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, update
 from typing import List
@@ -15,6 +15,7 @@ from app.schemas.dividend import (
     CreateDividendRequest,
     DividendPaymentResponse,
     DistributionProgressResponse,
+    DIVIDEND_PAYMENTS_ADAPTER,
 )
 from solders.pubkey import Pubkey
 from app.services.history import HistoryService
@@ -552,22 +553,23 @@ async def get_round_payments(
     result = await db.execute(query)
     payments = result.scalars().all()
 
-    return [
-        DividendPaymentResponse(
-            id=p.id,
-            round_id=p.round_id,
-            wallet=p.wallet,
-            shares=p.shares,
-            amount=p.amount,
-            status=p.status,
-            batch_number=p.batch_number,
-            created_at=p.created_at,
-            distributed_at=p.distributed_at,
-            signature=p.signature,
-            error_message=p.error_message,
-            dividend_per_share=round_obj.amount_per_share,
-        )
+    rows = DIVIDEND_PAYMENTS_ADAPTER.validate_python([
+        {
+            "id": p.id,
+            "round_id": p.round_id,
+            "wallet": p.wallet,
+            "shares": p.shares,
+            "amount": p.amount,
+            "status": p.status,
+            "batch_number": p.batch_number,
+            "created_at": p.created_at,
+            "distributed_at": p.distributed_at,
+            "signature": p.signature,
+            "error_message": p.error_message,
+            "dividend_per_share": round_obj.amount_per_share,
+        }
         for p in payments
-    ]
+    ])
+    return Response(DIVIDEND_PAYMENTS_ADAPTER.dump_json(rows), media_type="application/json")
 
 
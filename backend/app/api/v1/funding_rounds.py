@@ -23,6 +23,7 @@ from app.schemas.investment import (
     FundingRoundResponse,
     InvestmentResponse,
     ShareClassResponse,
+    INVESTMENTS_ADAPTER,
 )
 
 router = APIRouter()
@@ -71,7 +72,7 @@ def _build_funding_round_response(fr: FundingRound) -> FundingRoundResponse:
         share_class=_build_share_class_response(fr.share_class),
         status=fr.status,
         closed_at=fr.closed_at,
-        investments=[_build_investment_response(inv) for inv in (fr.investments or [])],
+        investments=INVESTMENTS_ADAPTER.validate_python(fr.investments or [], from_attributes=True),
         created_at=fr.created_at,
     )
 
@@ -151,7 +152,7 @@ async def create_funding_round(
     funding_round = FundingRound(
         token_id=token_id,
         name=request.name.strip(),
-        round_type=request.round_type.value,
+        round_type=request.round_type,
         pre_money_valuation=request.pre_money_valuation,
         amount_raised=0,
         post_money_valuation=request.pre_money_valuation,
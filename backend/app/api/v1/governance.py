@@ -282,16 +282,16 @@ async def vote_on_proposal(
         token_id=token_id,
         proposal_id=proposal_id,
         voter=voter,
-        vote=request.vote.value,
+        vote=request.vote,
         weight=vote_weight,
         signature=str(uuid.uuid4()),  # Placeholder - would be actual tx signature in production
     )
     db.add(vote_record)
 
     # Update vote counts
-    if request.vote.value == "for":
+    if request.vote == "for":
         proposal.votes_for += vote_weight
-    elif request.vote.value == "against":
+    elif request.vote == "against":
         proposal.votes_against += vote_weight
     else:  # abstain
         proposal.votes_abstain += vote_weight
@@ -312,11 +312,11 @@ async def vote_on_proposal(
         reference_type="proposal",
         data={
             "proposal_number": proposal.proposal_number,
-            "vote": request.vote.value,
+            "vote": request.vote,
             "vote_weight": vote_weight,
         },
         triggered_by=voter,
-        notes=f"Vote {request.vote.value} on proposal #{proposal.proposal_number}",
+        notes=f"Vote {request.vote} on proposal #{proposal.proposal_number}",
     )
 
     await db.commit()
@@ -324,7 +324,7 @@ async def vote_on_proposal(
 
     return {
         "success": True,
-        "message": f"Vote recorded: {request.vote.value}",
+        "message": f"Vote recorded: {request.vote}",
         "vote_weight": vote_weight,
         "votes_for": proposal.votes_for,
         "votes_against": proposal.votes_against,
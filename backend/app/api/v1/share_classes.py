@@ -1,7 +1,7 @@
 """Share Classes API endpoints"""
 from datetime import datetime
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, Path
+from fastapi import APIRouter, Depends, HTTPException, Path, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
@@ -22,6 +22,7 @@ from app.schemas.investment import (
     SharePositionResponse,
     IssueSharesRequest,
     IssueSharesResponse,
+    SHARE_POSITIONS_ADAPTER,
 )
 
 router = APIRouter()
@@ -183,12 +184,14 @@ async def get_share_class_positions(
     current_price = share_class.token.current_price_per_share or 0
 
     # Build positions from reconstructed state
+    class_response = _build_share_class_response(share_class)
     positions = []
     for (wallet, class_id), pos_state in state.positions.items():
         if class_id == share_class_id and pos_state.shares > 0:
-            positions.append(SharePositionResponse(
+            # Values are computed server-side from reconstructed state, so skip validation
+            positions.append(SharePositionResponse.model_construct(
                 wallet=wallet,
-                share_class=_build_share_class_response(share_class),
+                share_class=class_response,
                 shares=pos_state.shares,
                 cost_basis=pos_state.cost_basis,
                 price_per_share=pos_state.cost_basis // pos_state.shares if pos_state.shares > 0 else 0,
@@ -199,7 +202,7 @@ async def get_share_class_positions(
     # Sort by shares descending
     positions.sort(key=lambda p: p.shares, reverse=True)
 
-    return positions
+    return Response(SHARE_POSITIONS_ADAPTER.dump_json(positions), media_type="application/json")
 
 
 @router.put("/{share_class_id}", response_model=ShareClassResponse)
@@ -336,7 +339,7 @@ async def get_recent_share_positions(
 
     current_price = token.current_price_per_share or 0
 
-    return [
+    positions = [
         SharePositionResponse(
             id=g.id,
             wallet=g.wallet,
@@ -352,6 +355,8 @@ async def get_recent_share_positions(
         for g in grants
     ]
 
+    return Response(SHARE_POSITIONS_ADAPTER.dump_json(positions), media_type="application/json")
+
 
 @router.post("/issue", response_model=IssueSharesResponse)
 async def issue_shares(
@@ -1,10 +1,12 @@
 """Simulator API endpoints for waterfall and dilution calculations"""
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, Path
+from typing import Dict, List
+from fastapi import APIRouter, Depends, HTTPException, Path, Response
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 
+from app.api.responses import model_json_response
 from app.models.database import get_db
 from app.models.token import Token
 from app.models.share_class import ShareClass, SharePosition
@@ -32,6 +34,8 @@ from app.schemas.investment import (
 
 router = APIRouter()
 
+_SCENARIOS_ADAPTER = TypeAdapter(Dict[str, List[WaterfallResponse]])
+
 
 async def _get_waterfall_positions(token_id: int, db: AsyncSession) -> List[WaterfallPosition]:
     """Get all share positions formatted for waterfall calculation using transaction reconstruction"""
@@ -144,7 +148,7 @@ async def simulate_waterfall(
     # Calculate waterfall
     result = calculate_waterfall(positions, request.exit_amount)
 
-    return _build_waterfall_response(result)
+    return model_json_response(_build_waterfall_response(result))
 
 
 @router.post("/waterfall/scenarios")
@@ -184,9 +188,10 @@ async def simulate_waterfall_scenarios(
     # Calculate scenarios
     results = calculate_waterfall_scenarios(positions, request.exit_amounts)
 
-    return {
-        "scenarios": [_build_waterfall_response(r).model_dump() for r in results]
-    }
+    return Response(
+        _SCENARIOS_ADAPTER.dump_json({"scenarios": [_build_waterfall_response(r) for r in results]}),
+        media_type="application/json",
+    )
 
 
 @router.post("/dilution", response_model=DilutionResponse)
@@ -269,7 +274,7 @@ async def simulate_dilution(
     # Calculate dilution
     result = calculate_dilution(current_holders, current_valuation, simulated_rounds)
 
-    return DilutionResponse(
+    return model_json_response(DilutionResponse(
         rounds=[
             {
                 "name": r.name,
@@ -312,4 +317,4 @@ async def simulate_dilution(
             )
             for i in result.new_investors
         ],
-    )
+    ))
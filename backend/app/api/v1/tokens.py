@@ -108,7 +108,7 @@ async def get_token_info(token_id: int, db: AsyncSession = Depends(get_db)):
     client = await get_solana_client()
     try:
         mint_pubkey = Pubkey.from_string(token.mint_address)
-        account_info = await client.get_account_info(mint_pubkey)
+        account_info = await client.account_loader.load(mint_pubkey)
 
         return TokenInfoResponse(
             id=token.id,
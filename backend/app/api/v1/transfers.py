@@ -1,6 +1,6 @@
 """Transfer API endpoints"""
 from datetime import datetime, timedelta
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy import select, func, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -11,6 +11,7 @@ from app.schemas.transfer import (
     TransferResponse,
     TransferListResponse,
     TransferStatsResponse,
+    TRANSFERS_ADAPTER,
 )
 
 router = APIRouter()
@@ -123,4 +124,7 @@ async def get_recent_transfers(
     result = await db.execute(query)
     transfers = result.scalars().all()
 
-    return [TransferResponse.model_validate(t) for t in transfers]
+    return Response(
+        TRANSFERS_ADAPTER.dump_json(TRANSFERS_ADAPTER.validate_python(transfers, from_attributes=True)),
+        media_type="application/json",
+    )
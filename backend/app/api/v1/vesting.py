@@ -252,12 +252,12 @@ async def create_vesting_schedule(
         "hour": 3600,
         "day": 86400,
         "month": 30 * 86400,
-    }.get(request.interval.value, 60)
+    }.get(request.interval, 60)
     vesting_duration = request.duration_seconds - request.cliff_seconds
     if vesting_duration < interval_seconds:
         raise HTTPException(
             status_code=400,
-            detail=f"Vesting duration after cliff must be at least one {request.interval.value}"
+            detail=f"Vesting duration after cliff must be at least one {request.interval}"
         )
 
     # Build transaction data
@@ -282,7 +282,7 @@ async def create_vesting_schedule(
         start_time=datetime.utcfromtimestamp(request.start_time),
         cliff_seconds=request.cliff_seconds,
         duration_seconds=request.duration_seconds,
-        interval=request.interval.value,
+        interval=request.interval,
         intervals_released=0,
         vesting_type=None,  # Deprecated
         revocable=request.revocable,
@@ -320,7 +320,7 @@ async def create_vesting_schedule(
             "start_time": request.start_time,
             "duration_seconds": request.duration_seconds,
             "cliff_seconds": request.cliff_seconds,
-            "interval": request.interval.value,
+            "interval": request.interval,
             "total_intervals": total_intervals,
             "amount_per_interval": amount_per_interval,
             "revocable": request.revocable,
@@ -346,7 +346,7 @@ async def create_vesting_schedule(
                 "start_time": request.start_time,
                 "cliff_duration": request.cliff_seconds,
                 "total_duration": request.duration_seconds,
-                "interval": request.interval.value,
+                "interval": request.interval,
                 "revocable": request.revocable,
             }
         }
@@ -492,7 +492,7 @@ async def terminate_vesting(
         raise HTTPException(status_code=400, detail="Vesting schedule is not revocable")
 
     # Calculate preview
-    preview = _calculate_termination_preview(schedule, request.termination_type)
+    preview = _calculate_termination_preview(schedule, TerminationType(request.termination_type))
 
     # Calculate how much newly vests due to termination (for accelerated, this is the difference)
     previously_released = schedule.released_amount
@@ -500,7 +500,7 @@ async def terminate_vesting(
 
     # Update schedule in database (for demo/testing)
     # In production, this would be updated after on-chain tx confirms
-    schedule.termination_type = request.termination_type.value
+    schedule.termination_type = request.termination_type
     schedule.terminated_at = datetime.utcnow()
     schedule.vested_at_termination = preview.final_vested
     schedule.released_amount = preview.final_vested  # Mark all vested tokens as released
@@ -531,7 +531,7 @@ async def terminate_vesting(
         reference_type="vesting_schedule",
         triggered_by="api:terminate_vesting",
         data={
-            "termination_type": request.termination_type.value,
+            "termination_type": request.termination_type,
             "current_vested": preview.current_vested,
             "final_vested": preview.final_vested,
             "to_treasury": preview.to_treasury,
@@ -549,7 +549,7 @@ async def terminate_vesting(
     token = result.scalar_one_or_none()
 
     return {
-        "message": f"Successfully terminated vesting schedule ({request.termination_type.value})",
+        "message": f"Successfully terminated vesting schedule ({request.termination_type})",
         "vesting_pda": schedule_id,
         "preview": {
             "current_vested": preview.current_vested,
@@ -561,7 +561,7 @@ async def terminate_vesting(
             "action": "terminate_vesting",
             "data": {
                 "schedule_id": schedule_id,
-                "termination_type": request.termination_type.value,
+                "termination_type": request.termination_type,
             }
         }
     }
@@ -24,6 +24,7 @@ class Settings(BaseSettings):
     solana_cluster: str = "devnet"
     solana_rpc_url: str = "https://api.devnet.solana.com"
     solana_ws_url: str = "wss://api.devnet.solana.com"
+    rpc_concurrency: int = 16  # Max in-flight RPC requests per client
 
     # Program IDs (will be updated after deployment)
     factory_program_id: str = "Fg6PaFpoGXkYsidMpWTK6W2BeZ7FEfcYkg476zPFsLnS"
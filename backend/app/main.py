@@ -6,6 +6,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import get_settings
+from app.api.responses import ORJSONResponse
 from app.api.v1.router import api_router
 from app.api.websocket import websocket_router
 from app.models.database import init_db, close_db, async_session_factory
@@ -92,6 +93,7 @@ def create_app() -> FastAPI:
         version=settings.app_version,
         description="API for ChainEquity tokenized securities platform",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
         docs_url="/docs",
         redoc_url="/redoc",
     )
@@ -2,7 +2,7 @@
 from app.models.database import Base, get_db
 from app.models.token import Token, TokenFeatures
 from app.models.wallet import Wallet, WalletRestriction
-from app.models.transaction import Transfer, CorporateAction
+from app.models.transaction import Transfer, CorporateAction, IndexerCursor
 from app.models.vesting import VestingSchedule
 from app.models.dividend import DividendRound, DividendClaim
 from app.models.governance import Proposal, VoteRecord
@@ -29,6 +29,7 @@ __all__ = [
     "WalletRestriction",
     "Transfer",
     "CorporateAction",
+    "IndexerCursor",
     "VestingSchedule",
     "DividendRound",
     "DividendClaim",
@@ -1,16 +1,45 @@
 """Database connection and session management"""
+import json
+from datetime import date, datetime, time
+from uuid import UUID
+
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
 
 from app.config import get_settings
 
 settings = get_settings()
 
+
+def _json_default(value: Any) -> Any:
+    """Encode the non-JSON types orjson handles natively, for the stdlib fallback"""
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def json_serializer(value: Any) -> str:
+    """Serialize JSON/JSONB bind values with orjson (asyncpg expects text).
+
+    orjson rejects integers wider than 64 bits, which on-chain u64/u128
+    amounts can exceed; those payloads fall back to the stdlib encoder.
+    """
+    try:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+    except orjson.JSONEncodeError:
+        return json.dumps(value, default=_json_default, separators=(",", ":"))
+
+
 engine = create_async_engine(
     settings.database_url,
     pool_size=settings.database_pool_size,
     echo=settings.debug,
+    json_serializer=json_serializer,
+    json_deserializer=orjson.loads,
 )
 
 async_session_factory = async_sessionmaker(
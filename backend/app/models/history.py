@@ -16,6 +16,8 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Text,
+    DDL,
+    event,
     Enum as SQLEnum,
 )
 from sqlalchemy.dialects.postgresql import JSONB
@@ -128,3 +130,25 @@ class CapTableSnapshotV2(Base):
 
     # Relationship
     token = relationship("Token", backref="snapshots_v2")
+
+
+def _lz4_compression_ddl(*columns: str) -> DDL:
+    """ALTER TABLE setting lz4 TOAST compression on the given columns (PostgreSQL only)"""
+    alters = ', '.join(f'ALTER COLUMN {column} SET COMPRESSION lz4' for column in columns)
+    return DDL(f'ALTER TABLE %(table)s {alters}').execute_if(dialect='postgresql')
+
+
+# These tables are created by init_db rather than alembic, so lz4 (faster than
+# the default pglz at a similar ratio for these large, always-read-whole JSONB
+# payloads) is applied as they are created; migration 9d3b6e1f04a7 covers
+# tables that already existed
+event.listen(
+    StateChange.__table__,
+    'after_create',
+    _lz4_compression_ddl('old_state', 'new_state'),
+)
+event.listen(
+    CapTableSnapshotV2.__table__,
+    'after_create',
+    _lz4_compression_ddl('token_state', 'holders', 'share_positions', 'vesting_schedules', 'share_classes'),
+)
@@ -64,3 +64,16 @@ class Transaction(Base):
 
     def __repr__(self):
         return f"<Transaction {self.signature[:16]}... (slot={self.slot})>"
+
+
+class IndexerCursor(Base):
+    """Newest indexed signature per program, so the indexer resumes after a restart"""
+    __tablename__ = "indexer_cursors"
+
+    program = Column(String(20), primary_key=True)  # factory, token, governance
+    last_signature = Column(String(88), nullable=False)
+    slot = Column(BigInteger, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<IndexerCursor {self.program} (slot={self.slot})>"
@@ -92,7 +92,7 @@ class UnifiedTransaction(Base):
     reference_type = Column(String(50), nullable=True)  # Type: vesting_schedule, proposal, etc.
 
     # Flexible data for type-specific fields
-    data = Column(JSONB, nullable=True)
+    data = Column(JSONB(none_as_null=True), nullable=True)
 
     # Transaction metadata
     tx_signature = Column(String(100), nullable=True, index=True)  # Solana signature
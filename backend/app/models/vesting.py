@@ -1,8 +1,9 @@
 """Vesting schedule models"""
 from datetime import datetime
 from enum import Enum
-from sqlalchemy import Column, Integer, String, BigInteger, Boolean, DateTime, ForeignKey, Text
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, BigInteger, Boolean, DateTime, ForeignKey, Text, SmallInteger
+from sqlalchemy.types import TypeDecorator
+from sqlalchemy.orm import relationship, reconstructor
 
 from app.models.database import Base
 
@@ -25,13 +26,36 @@ class VestingInterval(str, Enum):
 
     def to_seconds(self) -> int:
         """Get interval duration in seconds"""
-        intervals = {
-            VestingInterval.MINUTE: 60,
-            VestingInterval.HOUR: 3600,
-            VestingInterval.DAY: 86400,
-            VestingInterval.MONTH: 30 * 86400,
-        }
-        return intervals[self]
+        return INTERVAL_SECONDS[self]
+
+
+# Interval durations keyed by value (str-enum members hash like their value)
+INTERVAL_SECONDS = {
+    VestingInterval.MINUTE: 60,
+    VestingInterval.HOUR: 3600,
+    VestingInterval.DAY: 86400,
+    VestingInterval.MONTH: 30 * 86400,
+}
+
+# SMALLINT storage codes for the interval column - index is the stored value
+INTERVAL_CODES = ("minute", "hour", "day", "month")
+
+
+class VestingIntervalType(TypeDecorator):
+    """Stores a vesting interval name as a SMALLINT code"""
+    impl = SmallInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        # Unknown intervals store as minute, matching _interval_params
+        return INTERVAL_CODES.index(value) if value in INTERVAL_CODES else 0
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return INTERVAL_CODES[value]
 
 
 class VestingSchedule(Base):
@@ -58,7 +82,7 @@ class VestingSchedule(Base):
     cliff_seconds = Column(BigInteger, nullable=False, default=0)
     duration_seconds = Column(BigInteger, nullable=False)
     # New: interval-based vesting (minute/hour/day/month)
-    interval = Column(String(10), nullable=False, default="minute")
+    interval = Column(VestingIntervalType, nullable=False, default="minute")
     intervals_released = Column(BigInteger, nullable=False, default=0)
     # Deprecated: vesting_type kept for backward compatibility
     vesting_type = Column(String(20), nullable=True)
@@ -83,34 +107,55 @@ class VestingSchedule(Base):
     def is_terminated(self) -> bool:
         return self.termination_type is not None
 
+    @reconstructor
+    def _init_on_load(self):
+        """Reset the memoized interval math when loaded from the database"""
+        self._interval_cache = None
+
+    def _interval_params(self) -> tuple[int, int, int, int]:
+        """Memoized (interval_seconds, total_intervals, amount_per_interval, remainder).
+
+        Keyed on the inputs, so in-place updates (e.g. a stock split changing
+        total_amount) recompute instead of returning stale values.
+        """
+        key = (self.interval, self.duration_seconds, self.cliff_seconds, self.total_amount)
+        cache = getattr(self, "_interval_cache", None)
+        if cache is not None and cache[0] == key:
+            return cache[1]
+
+        interval_seconds = INTERVAL_SECONDS.get(self.interval, 60)  # Default to minute if invalid
+
+        vesting_duration = self.duration_seconds - self.cliff_seconds
+        if vesting_duration <= 0:
+            total_intervals = 1
+        else:
+            total_intervals = max(1, vesting_duration // interval_seconds)
+
+        params = (
+            interval_seconds,
+            total_intervals,
+            self.total_amount // total_intervals,
+            self.total_amount % total_intervals,
+        )
+        self._interval_cache = (key, params)
+        return params
+
     @property
     def interval_seconds(self) -> int:
         """Get interval duration in seconds"""
-        try:
-            return VestingInterval(self.interval).to_seconds()
-        except ValueError:
-            return 60  # Default to minute if invalid
+        return self._interval_params()[0]
 
     def total_intervals(self) -> int:
         """Calculate total number of vesting intervals (after cliff)"""
-        vesting_duration = self.duration_seconds - self.cliff_seconds
-        if vesting_duration <= 0:
-            return 1
-        return max(1, vesting_duration // self.interval_seconds)
+        return self._interval_params()[1]
 
     def amount_per_interval(self) -> int:
         """Calculate amount per interval (equal distribution)"""
-        total = self.total_intervals()
-        if total == 0:
-            return self.total_amount
-        return self.total_amount // total
+        return self._interval_params()[2]
 
     def remainder(self) -> int:
         """Calculate remainder to add to final intervals"""
-        total = self.total_intervals()
-        if total == 0:
-            return 0
-        return self.total_amount % total
+        return self._interval_params()[3]
 
     def calculate_vested(self, current_time: datetime) -> int:
         """Calculate vested amount at a given time using discrete intervals.
@@ -137,17 +182,12 @@ class VestingSchedule(Base):
         if elapsed < self.cliff_seconds:
             return 0
 
-        # Calculate intervals elapsed after cliff
-        time_after_cliff = elapsed - self.cliff_seconds
-        intervals_elapsed = int(time_after_cliff // self.interval_seconds)
-
         # Get interval calculations
-        total_intervals = self.total_intervals()
-        amount_per = self.amount_per_interval()
-        rem = self.remainder()
+        interval_seconds, total_intervals, amount_per, rem = self._interval_params()
 
-        if total_intervals == 0:
-            return self.total_amount
+        # Calculate intervals elapsed after cliff
+        time_after_cliff = elapsed - self.cliff_seconds
+        intervals_elapsed = int(time_after_cliff // interval_seconds)
 
         # Base vested amount
         vested = amount_per * intervals_elapsed
@@ -168,13 +208,15 @@ class VestingSchedule(Base):
         if elapsed < 0 or elapsed < self.cliff_seconds:
             return 0
 
+        interval_seconds, total_intervals, _, _ = self._interval_params()
+
         # If past total duration, all intervals should be released
         if elapsed >= self.duration_seconds:
-            return self.total_intervals() - self.intervals_released
+            return total_intervals - self.intervals_released
 
         # Calculate intervals elapsed after cliff
         time_after_cliff = elapsed - self.cliff_seconds
-        intervals_elapsed = int(time_after_cliff // self.interval_seconds)
+        intervals_elapsed = int(time_after_cliff // interval_seconds)
 
         # Return new intervals (not yet released)
         return max(0, intervals_elapsed - self.intervals_released)
@@ -1,5 +1,6 @@
 """Cap-table schemas"""
-from pydantic import BaseModel
+from dataclasses import dataclass
+from pydantic import BaseModel, TypeAdapter
 from datetime import datetime
 from typing import List, Optional
 from enum import Enum
@@ -11,7 +12,9 @@ class ExportFormat(str, Enum):
     PDF = "pdf"
 
 
-class CapTableEntryResponse(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class CapTableEntryResponse:
+    """Cap table row - built server-side, so a plain dataclass skips re-validation"""
     wallet: str
     balance: int
     ownership_pct: float
@@ -49,7 +52,8 @@ class ShareClassSummary(BaseModel):
     holder_count: int
 
 
-class EnhancedCapTableEntry(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class EnhancedCapTableEntry:
     """Enhanced cap table entry with dollar values and share class info"""
     wallet: str
     share_class_id: int
@@ -108,3 +112,7 @@ class EnhancedCapTableByWalletResponse(BaseModel):
     total_shares: int
     holder_count: int
     wallets: List[WalletSummary]
+
+
+# Cached adapters for dumping long row lists straight to JSON
+HOLDERS_ADAPTER = TypeAdapter(List[CapTableEntryResponse])
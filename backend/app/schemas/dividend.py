@@ -1,5 +1,5 @@
 """Dividend schemas"""
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 from datetime import datetime
 from typing import Optional, List
 
@@ -62,3 +62,8 @@ DividendClaimResponse = DividendPaymentResponse
 class UnclaimedDividendsResponse(BaseModel):
     total_unclaimed: int
     rounds: List[DividendRoundResponse]
+
+
+# Cached adapter for validating and dumping payment lists in one call
+# (shared by the DividendClaimResponse alias)
+DIVIDEND_PAYMENTS_ADAPTER = TypeAdapter(List[DividendPaymentResponse])
@@ -1,7 +1,7 @@
 """Factory schemas"""
 from pydantic import BaseModel
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Tuple
 
 
 class FactoryInfo(BaseModel):
@@ -20,6 +20,20 @@ class TokenListResponse(BaseModel):
     created_at: datetime
 
 
+class TokenFeaturesSchema(BaseModel):
+    """Feature flags stored on a token (legacy tokens may omit keys)"""
+    vesting_enabled: Optional[bool] = None
+    governance_enabled: Optional[bool] = None
+    dividends_enabled: Optional[bool] = None
+    transfer_restrictions_enabled: Optional[bool] = None
+    upgradeable: Optional[bool] = None
+    admin_signers: Optional[List[str]] = None
+    admin_threshold: Optional[int] = None
+
+    class Config:
+        extra = "allow"
+
+
 class TokenDetailResponse(BaseModel):
     token_id: int
     on_chain_config: str
@@ -28,7 +42,7 @@ class TokenDetailResponse(BaseModel):
     name: str
     decimals: int
     total_supply: int
-    features: Dict[str, Any]
+    features: TokenFeaturesSchema
     is_paused: bool
     created_at: datetime
 
@@ -47,7 +61,7 @@ class CreateTokenRequest(BaseModel):
     decimals: int = 0
     initial_supply: int
     features: TokenFeaturesRequest
-    admin_signers: List[str]
+    admin_signers: Tuple[str, ...]
     admin_threshold: int
     template_id: Optional[int] = None
 
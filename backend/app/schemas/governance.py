@@ -1,14 +1,11 @@
 """Governance schemas"""
 from pydantic import BaseModel
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Literal
 from enum import Enum
 
 
-class VoteChoice(str, Enum):
-    FOR = "for"
-    AGAINST = "against"
-    ABSTAIN = "abstain"
+VoteChoice = Literal["for", "against", "abstain"]
 
 
 class ProposalStatus(str, Enum):
@@ -1,36 +1,24 @@
 """Schemas for investment modeling APIs"""
+from dataclasses import dataclass
 from datetime import datetime, date
-from typing import Optional, List
-from pydantic import BaseModel
-from enum import Enum
+from typing import Annotated, Optional, List, Literal, Tuple, Union
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 # =============================================================================
-# Enums
+# Types
 # =============================================================================
 
-class RoundType(str, Enum):
-    """Types of funding rounds"""
-    PRE_SEED = "pre_seed"
-    SEED = "seed"
-    SERIES_A = "series_a"
-    SERIES_B = "series_b"
-    SERIES_C = "series_c"
-    BRIDGE = "bridge"
-    REVALUATION = "revaluation"  # Zero-dollar round to change company valuation
-    OTHER = "other"
+# Types of funding rounds ("revaluation" is a zero-dollar round to change company valuation)
+RoundType = Literal[
+    "pre_seed", "seed", "series_a", "series_b", "series_c", "bridge", "revaluation", "other"
+]
 
+# Types of convertible instruments
+InstrumentType = Literal["safe", "convertible_note"]
 
-class InstrumentType(str, Enum):
-    """Types of convertible instruments"""
-    SAFE = "safe"
-    CONVERTIBLE_NOTE = "convertible_note"
-
-
-class SafeType(str, Enum):
-    """Types of SAFE agreements"""
-    PRE_MONEY = "pre_money"
-    POST_MONEY = "post_money"
+# Types of SAFE agreements
+SafeType = Literal["pre_money", "post_money"]
 
 
 # =============================================================================
@@ -58,6 +46,8 @@ class ShareClassResponse(BaseModel):
 
     class Config:
         from_attributes = True
+        frozen = True
+        extra = "forbid"
 
 
 class SharePositionResponse(BaseModel):
@@ -73,6 +63,11 @@ class SharePositionResponse(BaseModel):
     slot: Optional[int] = None  # Solana slot at time of issuance
     acquired_at: Optional[datetime] = None
 
+    class Config:
+        from_attributes = True
+        frozen = True
+        extra = "forbid"
+
 
 # =============================================================================
 # Share Issuance Schemas
@@ -107,7 +102,7 @@ class BulkIssueSharesRequest(BaseModel):
     """Request to issue shares to multiple wallets"""
     share_class_id: int
     price_per_share: float = 0  # In cents (float for precision)
-    issuances: List[IssueSharesRequest]
+    issuances: Tuple[IssueSharesRequest, ...]
 
 
 # =============================================================================
@@ -128,6 +123,8 @@ class InvestmentResponse(BaseModel):
 
     class Config:
         from_attributes = True
+        frozen = True
+        extra = "forbid"
 
 
 class AddInvestmentRequest(BaseModel):
@@ -168,27 +165,43 @@ class FundingRoundResponse(BaseModel):
 
     class Config:
         from_attributes = True
+        frozen = True
+        extra = "forbid"
 
 
 # =============================================================================
 # Convertible Instrument Schemas
 # =============================================================================
 
-class CreateConvertibleRequest(BaseModel):
-    """Request to create a convertible instrument (SAFE or note)"""
-    instrument_type: InstrumentType
+class ConvertibleRequestBase(BaseModel):
+    """Fields shared by SAFE and convertible note requests"""
     name: Optional[str] = None
     holder_wallet: str
     holder_name: Optional[str] = None
     principal_amount: int  # In cents
     valuation_cap: Optional[int] = None  # In cents
     discount_rate: Optional[float] = None  # 0.20 = 20%
-    # For convertible notes
+    notes: Optional[str] = None
+
+
+class CreateSafeRequest(ConvertibleRequestBase):
+    """Request to create a SAFE"""
+    instrument_type: Literal["safe"]
+    safe_type: Optional[SafeType] = None
+
+
+class CreateNoteRequest(ConvertibleRequestBase):
+    """Request to create a convertible note"""
+    instrument_type: Literal["convertible_note"]
     interest_rate: Optional[float] = None  # 0.05 = 5%
     maturity_date: Optional[date] = None
-    # For SAFEs
-    safe_type: Optional[SafeType] = None
-    notes: Optional[str] = None
+
+
+# Request to create a convertible instrument - validator is picked by instrument_type
+CreateConvertibleRequest = Annotated[
+    Union[CreateSafeRequest, CreateNoteRequest],
+    Field(discriminator="instrument_type"),
+]
 
 
 class ConvertibleResponse(BaseModel):
@@ -213,6 +226,8 @@ class ConvertibleResponse(BaseModel):
 
     class Config:
         from_attributes = True
+        frozen = True
+        extra = "forbid"
 
 
 class ConvertConvertibleRequest(BaseModel):
@@ -245,11 +260,15 @@ class ValuationResponse(BaseModel):
 
     class Config:
         from_attributes = True
+        frozen = True
+        extra = "forbid"
 
 
 # =============================================================================
 # Simulator Schemas
 # =============================================================================
+# Result rows are produced by the calculators from trusted data, so they are
+# plain dataclasses; only the outer responses are pydantic models.
 
 class WaterfallRequest(BaseModel):
     """Request to simulate liquidation waterfall"""
@@ -258,10 +277,11 @@ class WaterfallRequest(BaseModel):
 
 class WaterfallScenariosRequest(BaseModel):
     """Request to simulate waterfall for multiple exit amounts"""
-    exit_amounts: List[int]  # In cents
+    exit_amounts: Tuple[int, ...]  # In cents
 
 
-class WaterfallPayoutResponse(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class WaterfallPayoutResponse:
     """Payout for a single holder in waterfall"""
     wallet: str
     share_class_name: str
@@ -274,7 +294,8 @@ class WaterfallPayoutResponse(BaseModel):
     payout_source: str  # "preference", "partial_preference", "conversion", "common", "none"
 
 
-class WaterfallTierResponse(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class WaterfallTierResponse:
     """Results for a single priority tier"""
     priority: int
     total_preference: int
@@ -305,7 +326,8 @@ class DilutionRequest(BaseModel):
     rounds: List[SimulatedRoundRequest]
 
 
-class DilutedPositionResponse(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class DilutedPositionResponse:
     """A holder's position after dilution"""
     wallet: str
     shares_before: int
@@ -317,7 +339,8 @@ class DilutedPositionResponse(BaseModel):
     value_after: int
 
 
-class NewInvestorResponse(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class NewInvestorResponse:
     """New investor position from simulated round"""
     round_name: str
     amount_invested: int
@@ -333,3 +356,8 @@ class DilutionResponse(BaseModel):
     after: dict
     existing_holders: List[DilutedPositionResponse]
     new_investors: List[NewInvestorResponse]
+
+
+# Cached adapters for dumping long row lists straight to JSON
+SHARE_POSITIONS_ADAPTER = TypeAdapter(List[SharePositionResponse])
+INVESTMENTS_ADAPTER = TypeAdapter(List[InvestmentResponse])
@@ -3,6 +3,8 @@ from pydantic import BaseModel
 from typing import Optional, Dict, Any
 from datetime import datetime
 
+from app.schemas.factory import TokenFeaturesSchema
+
 
 class MintRequest(BaseModel):
     recipient: str
@@ -48,7 +50,7 @@ class TokenInfoResponse(BaseModel):
     total_supply: int
     created_at: datetime
     on_chain_exists: bool = False
-    features: Optional[Dict[str, Any]] = None
+    features: Optional[TokenFeaturesSchema] = None
     holder_count: Optional[int] = None
     transfer_count_24h: Optional[int] = None
     error: Optional[str] = None
@@ -1,7 +1,7 @@
 """Transfer schemas"""
 from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel
+from typing import List, Optional
+from pydantic import BaseModel, TypeAdapter
 
 
 class TransferResponse(BaseModel):
@@ -19,6 +19,8 @@ class TransferResponse(BaseModel):
 
     class Config:
         from_attributes = True
+        frozen = True
+        extra = "forbid"
 
 
 class TransferListResponse(BaseModel):
@@ -34,3 +36,7 @@ class TransferStatsResponse(BaseModel):
     total_transfers: int
     transfers_24h: int
     volume_24h: int
+
+
+# Cached adapter for dumping transfer lists straight to JSON
+TRANSFERS_ADAPTER = TypeAdapter(List[TransferResponse])
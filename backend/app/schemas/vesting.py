@@ -1,16 +1,12 @@
 """Vesting schemas"""
 from pydantic import BaseModel
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Literal
 from enum import Enum
 
 
-class VestingInterval(str, Enum):
-    """Vesting interval - how often tokens are released"""
-    MINUTE = "minute"
-    HOUR = "hour"
-    DAY = "day"
-    MONTH = "month"
+# Vesting interval - how often tokens are released
+VestingInterval = Literal["minute", "hour", "day", "month"]
 
 
 class TerminationType(str, Enum):
@@ -62,6 +58,11 @@ class VestingScheduleResponse(BaseModel):
     price_per_share: float = 0  # In cents (float for precision)
     preference_amount: int = 0  # Always 0 for vesting (common stock)
 
+    class Config:
+        from_attributes = True
+        frozen = True
+        extra = "forbid"
+
 
 class CreateVestingRequest(BaseModel):
     """Create a new vesting schedule.
@@ -77,7 +78,7 @@ class CreateVestingRequest(BaseModel):
     cliff_seconds: int = 0
     duration_seconds: int
     # New: interval-based vesting
-    interval: VestingInterval = VestingInterval.MINUTE
+    interval: VestingInterval = "minute"
     revocable: bool = False
     # Cost basis tracking (optional)
     cost_basis: int = 0  # In cents - what was paid for these shares (0 for grants)
@@ -85,7 +86,7 @@ class CreateVestingRequest(BaseModel):
 
 
 class TerminateVestingRequest(BaseModel):
-    termination_type: TerminationType
+    termination_type: Literal["standard", "for_cause", "accelerated"]
     notes: Optional[str] = None
 
 
@@ -3,20 +3,17 @@ from .solana_client import SolanaClient
 from .waterfall import calculate_waterfall, calculate_waterfall_scenarios, WaterfallPosition
 from .dilution import calculate_dilution, CurrentHolder, SimulatedRound
 from .transaction_service import TransactionService, TokenState
+from .event_processor import EventProcessor
 
-# Lazy imports for indexer (requires complete model setup)
+# Lazy import for indexer (requires complete model setup)
 def get_indexer():
     from .indexer import TransactionIndexer
     return TransactionIndexer
 
-def get_event_processor():
-    from .event_processor import EventProcessor
-    return EventProcessor
-
 __all__ = [
     "SolanaClient",
+    "EventProcessor",
     "get_indexer",
-    "get_event_processor",
     # Waterfall calculator
     "calculate_waterfall",
     "calculate_waterfall_scenarios",
@@ -3,11 +3,11 @@ Dilution Calculator Service
 
 Calculates the impact of hypothetical funding rounds on existing shareholders.
 """
-from typing import List, Dict, Any
-from dataclasses import dataclass
+from typing import List, Dict, Any, NamedTuple
+from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CurrentHolder:
     """Current shareholder for dilution calculation"""
     wallet: str
@@ -17,21 +17,20 @@ class CurrentHolder:
     ownership_pct: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SimulatedRound:
     """A hypothetical funding round"""
     name: str
     pre_money_valuation: int  # In cents
     amount_raised: int  # In cents
+    post_money_valuation: int = field(init=False)  # In cents
 
-    @property
-    def post_money_valuation(self) -> int:
-        return self.pre_money_valuation + self.amount_raised
+    def __post_init__(self):
+        object.__setattr__(self, "post_money_valuation", self.pre_money_valuation + self.amount_raised)
 
 
-@dataclass
-class DilutedPosition:
-    """A holder's position after dilution"""
+class DilutedPosition(NamedTuple):
+    """A holder's position after dilution (built once per holder, so kept as a cheap tuple)"""
     wallet: str
     shares_before: int
     shares_after: int  # Same as before (existing holders don't get new shares)
@@ -42,7 +41,7 @@ class DilutedPosition:
     value_after: int  # At final valuation
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NewInvestorPosition:
     """New investor position from simulated round"""
     round_name: str
@@ -52,7 +51,7 @@ class NewInvestorPosition:
     price_per_share: int
 
 
-@dataclass
+@dataclass(slots=True)
 class DilutionResult:
     """Complete dilution simulation result"""
     rounds: List[SimulatedRound]
@@ -158,7 +157,7 @@ def calculate_dilution(
         )
 
     # Initial state
-    shares_before = sum(h.shares for h in current_holders)
+    shares_before = sum([h.shares for h in current_holders])
     price_per_share_before = current_valuation // shares_before if shares_before > 0 else 0
 
     # Track running totals as we process each round
@@ -195,27 +194,26 @@ def calculate_dilution(
     price_per_share_after = running_valuation // total_shares if total_shares > 0 else 0
 
     # Calculate diluted positions for existing holders
+    # (totals are fixed from here on, so only per-holder arithmetic stays in the loop)
+    pct_per_share = (100 / total_shares) if total_shares > 0 else 0
     diluted_holders: List[DilutedPosition] = []
     for holder in current_holders:
-        # Ownership after all rounds
-        ownership_after = (holder.shares / total_shares * 100) if total_shares > 0 else 0
-
-        # Dilution = ownership lost (positive number means dilution)
-        dilution = holder.ownership_pct - ownership_after
+        shares = holder.shares
+        ownership_before = holder.ownership_pct
 
-        # Value calculations
-        value_before = holder.shares * price_per_share_before
-        value_after = holder.shares * price_per_share_after
+        # Ownership after all rounds
+        ownership_after = shares * pct_per_share
 
         diluted_holders.append(DilutedPosition(
             wallet=holder.wallet,
-            shares_before=holder.shares,
-            shares_after=holder.shares,  # Existing holders keep same shares
-            ownership_before=holder.ownership_pct,
+            shares_before=shares,
+            shares_after=shares,  # Existing holders keep same shares
+            ownership_before=ownership_before,
             ownership_after=round(ownership_after, 4),
-            dilution_pct=round(dilution, 4),
-            value_before=value_before,
-            value_after=value_after,
+            # Dilution = ownership lost (positive number means dilution)
+            dilution_pct=round(ownership_before - ownership_after, 4),
+            value_before=shares * price_per_share_before,
+            value_after=shares * price_per_share_after,
         ))
 
     return DilutionResult(
@@ -1,8 +1,13 @@
 """Event Processor for ChainEquity Solana Programs"""
 import base64
-from typing import Dict, Any, Optional, List
-from datetime import datetime
+import struct
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, Any, Optional, List, Tuple
+from datetime import datetime, timedelta
 import structlog
+from solders.pubkey import Pubkey
+from sqlalchemy import bindparam, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.token import Token
@@ -14,6 +19,80 @@ from app.models.transaction import Transaction
 
 logger = structlog.get_logger()
 
+# Anchor emits events as base64 on log lines starting with this prefix
+PROGRAM_DATA_PREFIX = "Program data: "
+
+# Shared fallback for transactions without meta (read-only, never handed out)
+_EMPTY_META: Dict[str, Any] = {}
+
+
+# Fixed-width Borsh layouts of the event payloads (after the discriminator)
+_U32 = struct.Struct("<I")
+_U64 = struct.Struct("<Q")
+_PUBKEY_PAIR = struct.Struct("<32s32s")
+_PUBKEY_PAIR_U64 = struct.Struct("<32s32sQ")
+_VESTING_CREATED = struct.Struct("<32s32s32sQqQQ")
+_VESTING_RELEASED = struct.Struct("<32sQQ")
+_VESTING_TERMINATED = struct.Struct("<32sBQ")
+_DIVIDEND_CREATED = struct.Struct("<32sQ32sQQ")
+_PROPOSAL_CREATED = struct.Struct("<32s32sQ32sI")  # Followed by the title bytes
+_VOTE_CAST = struct.Struct("<32s32sBQ")
+
+# Smallest well-formed payload per event type, checked before dispatch so
+# truncated events are dropped without raising inside the handlers
+_MIN_PAYLOAD_SIZES = {
+    "token_created": 32 + 4 + 4 + 1 + 8,  # mint, two empty strings, decimals, supply
+    "allowlist_added": _PUBKEY_PAIR.size,
+    "allowlist_removed": _PUBKEY_PAIR.size,
+    "tokens_minted": _PUBKEY_PAIR_U64.size,
+    "vesting_created": _VESTING_CREATED.size,
+    "vesting_released": _VESTING_RELEASED.size,
+    "vesting_terminated": _VESTING_TERMINATED.size,
+    "dividend_created": _DIVIDEND_CREATED.size,
+    "dividend_claimed": _PUBKEY_PAIR_U64.size,
+    "proposal_created": _PROPOSAL_CREATED.size,
+    "vote_cast": _VOTE_CAST.size,
+    "proposal_executed": 32,
+}
+
+
+# Update templates built once; values are bound per execution
+_ADD_TOKEN_SUPPLY = (
+    update(Token)
+    .where(Token.mint_address == bindparam("mint"))
+    .values(total_supply=Token.total_supply + bindparam("amount"))
+)
+_REVOKE_ALLOWLIST_ENTRY = (
+    update(AllowlistEntry)
+    .where(AllowlistEntry.token_config == bindparam("config"))
+    .where(AllowlistEntry.wallet_address == bindparam("wallet"))
+    .values(status="revoked", revoked_at=bindparam("revoked_time"))
+)
+
+# Naive UTC, matching how the rest of the backend stores chain timestamps
+_UNIX_EPOCH = datetime(1970, 1, 1)
+
+
+def _pubkey_str(raw: bytes) -> str:
+    """Encode a 32-byte pubkey field as a base58 Solana address"""
+    return str(Pubkey.from_bytes(raw))
+
+
+@dataclass
+class _TransactionContext:
+    """Per-transaction state shared by the event handlers.
+
+    Counter increments commute, so they are summed per row and written once
+    after every event is handled. Inserts already batch in the session's
+    unit of work and status updates keep their event order, so only deltas
+    are deferred.
+    """
+    # Record timestamp: block time, or a single wall-clock fallback for the whole transaction
+    timestamp: datetime
+    supply_deltas: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    # (proposal pubkey, vote_for) -> weight
+    vote_deltas: Dict[Tuple[str, bool], int] = field(default_factory=lambda: defaultdict(int))
+
 
 class EventProcessor:
     """
@@ -60,6 +139,12 @@ class EventProcessor:
         "transaction_executed": bytes([0x1a, 0x4b, 0xec, 0x2d, 0x5e, 0x0f, 0x3a, 0xdb]),
     }
 
+    # The first 10 base64 characters encode 60 bits of the discriminator alone, so other
+    # programs' events can be skipped before decoding (the full 8 bytes are checked after)
+    EVENT_B64_PREFIXES = frozenset(
+        base64.b64encode(disc)[:10].decode() for disc in EVENT_DISCRIMINATORS.values()
+    )
+
     async def process_transaction(
         self,
         session: AsyncSession,
@@ -71,22 +156,36 @@ class EventProcessor:
         Returns list of event types processed.
         """
         events_processed = []
+        ctx = _TransactionContext(timestamp=tx.block_time or datetime.utcnow())
 
         try:
             # Extract log messages from transaction
             logs = self._extract_logs(tx_data)
 
             # Look for Anchor event logs (base64 encoded after "Program data: ")
+            prefix_len = len(PROGRAM_DATA_PREFIX)
+            b64_prefixes = self.EVENT_B64_PREFIXES
             for log in logs:
-                if "Program data: " in log:
-                    data_b64 = log.split("Program data: ")[1]
+                if (
+                    log.startswith(PROGRAM_DATA_PREFIX)
+                    and log[prefix_len:prefix_len + 10] in b64_prefixes
+                ):
+                    data_b64 = log[prefix_len:]
                     try:
                         data = base64.b64decode(data_b64)
-                        event_type = self._identify_event(data)
-                        if event_type:
-                            await self._handle_event(
-                                session, event_type, data[8:], tx
-                            )
+                        route = self.EVENT_ROUTES.get(data[:8])
+                        if route:
+                            event_type, handler = route
+                            if len(data) - 8 < _MIN_PAYLOAD_SIZES.get(event_type, 0):
+                                logger.warning(
+                                    "Event payload too short",
+                                    event=event_type,
+                                    size=len(data) - 8,
+                                )
+                                continue
+                            if handler:
+                                # Handlers read the payload through a view, so it is never copied
+                                await handler(self, session, memoryview(data)[8:], tx, ctx)
                             events_processed.append(event_type)
                     except Exception as e:
                         logger.warning(
@@ -95,11 +194,13 @@ class EventProcessor:
                             error=str(e),
                         )
 
+            await self._flush_pending(session, ctx)
+
             if events_processed:
                 logger.info(
                     "Processed events",
                     signature=tx.signature[:16] + "...",
-                    events=events_processed,
+                    events=dict(Counter(events_processed)),
                 )
 
         except Exception as e:
@@ -112,84 +213,66 @@ class EventProcessor:
 
         return events_processed
 
+    async def _flush_pending(self, session: AsyncSession, ctx: _TransactionContext) -> None:
+        """Write the summed counter updates, one statement per row"""
+        for mint, amount in ctx.supply_deltas.items():
+            await session.execute(_ADD_TOKEN_SUPPLY, {"mint": mint, "amount": amount})
+
+        for (proposal_pubkey, vote_for), weight in ctx.vote_deltas.items():
+            if vote_for:
+                values = {"votes_for": Proposal.votes_for + weight}
+            else:
+                values = {"votes_against": Proposal.votes_against + weight}
+            await session.execute(
+                update(Proposal)
+                .where(Proposal.pubkey == proposal_pubkey)
+                .values(**values)
+            )
+
     def _extract_logs(self, tx_data: Dict[str, Any]) -> List[str]:
-        """Extract log messages from transaction data"""
-        try:
-            meta = tx_data.get("meta", {})
-            return meta.get("logMessages", [])
-        except Exception:
-            return []
+        """Extract log messages from transaction data (RPC sends null for missing fields)"""
+        meta = tx_data.get("meta") or _EMPTY_META
+        return meta.get("logMessages") or []
 
     def _identify_event(self, data: bytes) -> Optional[str]:
         """Identify event type from discriminator"""
         if len(data) < 8:
             return None
 
-        discriminator = data[:8]
-        for event_type, disc in self.EVENT_DISCRIMINATORS.items():
-            if discriminator == disc:
-                return event_type
-        return None
-
-    async def _handle_event(
-        self,
-        session: AsyncSession,
-        event_type: str,
-        data: bytes,
-        tx: Transaction,
-    ) -> None:
-        """Route event to appropriate handler"""
-        handlers = {
-            "token_created": self._handle_token_created,
-            "allowlist_added": self._handle_allowlist_added,
-            "allowlist_removed": self._handle_allowlist_removed,
-            "tokens_minted": self._handle_tokens_minted,
-            "tokens_transferred": self._handle_tokens_transferred,
-            "vesting_created": self._handle_vesting_created,
-            "vesting_released": self._handle_vesting_released,
-            "vesting_terminated": self._handle_vesting_terminated,
-            "dividend_created": self._handle_dividend_created,
-            "dividend_claimed": self._handle_dividend_claimed,
-            "proposal_created": self._handle_proposal_created,
-            "vote_cast": self._handle_vote_cast,
-            "proposal_executed": self._handle_proposal_executed,
-        }
-
-        handler = handlers.get(event_type)
-        if handler:
-            await handler(session, data, tx)
+        route = self.EVENT_ROUTES.get(data[:8])
+        return route[0] if route else None
 
     # Event handlers
 
     async def _handle_token_created(
         self,
         session: AsyncSession,
-        data: bytes,
+        data: memoryview,
         tx: Transaction,
+        ctx: _TransactionContext,
     ) -> None:
         """Handle token creation event"""
         # Decode event data (Borsh serialized)
         # Format: mint (32), symbol (string), name (string), decimals (u8), supply (u64)
         try:
-            offset = 0
-            mint = base64.b64encode(data[offset:offset + 32]).decode()
-            offset += 32
+            mint = _pubkey_str(bytes(data[0:32]))
+            offset = 32
 
             # String: 4 byte length prefix + data
-            symbol_len = int.from_bytes(data[offset:offset + 4], "little")
+            symbol_len = _U32.unpack_from(data, offset)[0]
             offset += 4
-            symbol = data[offset:offset + symbol_len].decode()
+            symbol = str(data[offset:offset + symbol_len], "utf-8")
             offset += symbol_len
 
-            name_len = int.from_bytes(data[offset:offset + 4], "little")
+            name_len = _U32.unpack_from(data, offset)[0]
             offset += 4
-            name = data[offset:offset + name_len].decode()
+            name = str(data[offset:offset + name_len], "utf-8")
             offset += name_len
 
             decimals = data[offset]
             offset += 1
 
-            initial_supply = int.from_bytes(data[offset:offset + 8], "little")
+            initial_supply = _U64.unpack_from(data, offset)[0]
 
             # Create or update token record
             token = Token(
@@ -198,12 +281,12 @@ class EventProcessor:
                 name=name,
                 decimals=decimals,
                 total_supply=initial_supply,
-                created_at=tx.block_time or datetime.utcnow(),
+                created_at=ctx.timestamp,
                 created_tx=tx.signature,
             )
             session.add(token)
 
-            logger.info(
+            logger.debug(
                 "Token created",
                 symbol=symbol,
                 mint=mint[:16] + "...",
@@ -215,24 +298,26 @@ class EventProcessor:
     async def _handle_allowlist_added(
         self,
         session: AsyncSession,
-        data: bytes,
+        data: memoryview,
         tx: Transaction,
+        ctx: _TransactionContext,
     ) -> None:
         """Handle allowlist addition event"""
         try:
-            token_config = base64.b64encode(data[0:32]).decode()
-            wallet = base64.b64encode(data[32:64]).decode()
+            token_config_raw, wallet_raw = _PUBKEY_PAIR.unpack_from(data)
+            token_config = _pubkey_str(token_config_raw)
+            wallet = _pubkey_str(wallet_raw)
 
             entry = AllowlistEntry(
                 token_config=token_config,
                 wallet_address=wallet,
                 status="active",
-                added_at=tx.block_time or datetime.utcnow(),
+                added_at=ctx.timestamp,
                 added_tx=tx.signature,
             )
             session.add(entry)
 
-            logger.info(
+            logger.debug(
                 "Wallet added to allowlist",
                 wallet=wallet[:16] + "...",
             )
@@ -243,24 +328,23 @@ class EventProcessor:
     async def _handle_allowlist_removed(
         self,
         session: AsyncSession,
-        data: bytes,
+        data: memoryview,
         tx: Transaction,
+        ctx: _TransactionContext,
     ) -> None:
         """Handle allowlist removal event"""
         try:
-            token_config = base64.b64encode(data[0:32]).decode()
-            wallet = base64.b64encode(data[32:64]).decode()
+            token_config_raw, wallet_raw = _PUBKEY_PAIR.unpack_from(data)
+            token_config = _pubkey_str(token_config_raw)
+            wallet = _pubkey_str(wallet_raw)
 
             # Update entry status
-            from sqlalchemy import update
             await session.execute(
-                update(AllowlistEntry)
-                .where(AllowlistEntry.token_config == token_config)
-                .where(AllowlistEntry.wallet_address == wallet)
-                .values(status="revoked", revoked_at=tx.block_time)
+                _REVOKE_ALLOWLIST_ENTRY,
+                {"config": token_config, "wallet": wallet, "revoked_time": tx.block_time},
             )
 
-            logger.info(
+            logger.debug(
                 "Wallet removed from allowlist",
                 wallet=wallet[:16] + "...",
             )
@@ -271,24 +355,20 @@ class EventProcessor:
     async def _handle_tokens_minted(
         self,
         session: AsyncSession,
-        data: bytes,
+        data: memoryview,
         tx: Transaction,
+        ctx: _TransactionContext,
     ) -> None:
         """Handle token mint event"""
         try:
-            mint = base64.b64encode(data[0:32]).decode()
-            recipient = base64.b64encode(data[32:64]).decode()
-            amount = int.from_bytes(data[64:72], "little")
+            mint_raw, recipient_raw, amount = _PUBKEY_PAIR_U64.unpack_from(data)
+            mint = _pubkey_str(mint_raw)
+            recipient = _pubkey_str(recipient_raw)
 
-            # Update token supply
-            from sqlalchemy import update
-            await session.execute(
-                update(Token)
-                .where(Token.mint_address == mint)
-                .values(total_supply=Token.total_supply + amount)
-            )
+            # Supply is bumped once per mint after all events are handled
+            ctx.supply_deltas[mint] += amount
 
-            logger.info(
+            logger.debug(
                 "Tokens minted",
                 amount=amount,
                 recipient=recipient[:16] + "...",
@@ -300,8 +380,9 @@ class EventProcessor:
     async def _handle_tokens_transferred(
         self,
         session: AsyncSession,
-        data: bytes,
+        data: memoryview,
         tx: Transaction,
+        ctx: _TransactionContext,
     ) -> None:
         """Handle token transfer event"""
         # Transfer events are handled by recording in transaction history
@@ -311,25 +392,19 @@ class EventProcessor:
     async def _handle_vesting_created(
         self,
         session: AsyncSession,
-        data: bytes,
+        data: memoryview,
         tx: Transaction,
+        ctx: _TransactionContext,
     ) -> None:
         """Handle vesting schedule creation"""
         try:
-            offset = 0
-            token_config = base64.b64encode(data[offset:offset + 32]).decode()
-            offset += 32
-            schedule_pubkey = base64.b64encode(data[offset:offset + 32]).decode()
-            offset += 32
-            beneficiary = base64.b64encode(data[offset:offset + 32]).decode()
-            offset += 32
-            total_amount = int.from_bytes(data[offset:offset + 8], "little")
-            offset += 8
-            start_time = int.from_bytes(data[offset:offset + 8], "little", signed=True)
-            offset += 8
-            cliff_duration = int.from_bytes(data[offset:offset + 8], "little")
-            offset += 8
-            total_duration = int.from_bytes(data[offset:offset + 8], "little")
+            (
+                token_config_raw, schedule_raw, beneficiary_raw,
+                total_amount, start_time, cliff_duration, total_duration,
+            ) = _VESTING_CREATED.unpack_from(data)
+            token_config = _pubkey_str(token_config_raw)
+            schedule_pubkey = _pubkey_str(schedule_raw)
+            beneficiary = _pubkey_str(beneficiary_raw)
 
             schedule = VestingSchedule(
                 pubkey=schedule_pubkey,
@@ -337,16 +412,16 @@ class EventProcessor:
                 beneficiary=beneficiary,
                 total_amount=total_amount,
                 released_amount=0,
-                start_time=datetime.fromtimestamp(start_time),
+                start_time=_UNIX_EPOCH + timedelta(seconds=start_time),
                 cliff_duration=cliff_duration,
                 total_duration=total_duration,
                 status=VestingStatus.ACTIVE,
-                created_at=tx.block_time or datetime.utcnow(),
+                created_at=ctx.timestamp,
                 created_tx=tx.signature,
             )
             session.add(schedule)
 
-            logger.info(
+            logger.debug(
                 "Vesting schedule created",
                 beneficiary=beneficiary[:16] + "...",
                 amount=total_amount,
@@ -358,23 +433,22 @@ class EventProcessor:
     async def _handle_vesting_released(
         self,
         session: AsyncSession,
-        data: bytes,
+        data: memoryview,
         tx: Transaction,
+        ctx: _TransactionContext,
     ) -> None:
         """Handle vesting release event"""
         try:
-            schedule_pubkey = base64.b64encode(data[0:32]).decode()
-            amount_released = int.from_bytes(data[32:40], "little")
-            total_released = int.from_bytes(data[40:48], "little")
+            schedule_raw, amount_released, total_released = _VESTING_RELEASED.unpack_from(data)
+            schedule_pubkey = _pubkey_str(schedule_raw)
 
-            from sqlalchemy import update
             await session.execute(
                 update(VestingSchedule)
                 .where(VestingSchedule.pubkey == schedule_pubkey)
                 .values(released_amount=total_released)
             )
 
-            logger.info(
+            logger.debug(
                 "Vesting tokens released",
                 schedule=schedule_pubkey[:16] + "...",
                 amount=amount_released,
@@ -386,14 +460,15 @@ class EventProcessor:
     async def _handle_vesting_terminated(
         self,
         session: AsyncSession,
-        data: bytes,
+        data: memoryview,
         tx: Transaction,
+        ctx: _TransactionContext,
     ) -> None:
         """Handle vesting termination event"""
         try:
-            schedule_pubkey = base64.b64encode(data[0:32]).decode()
-            termination_type = data[32]  # 0=Standard, 1=ForCause, 2=Accelerated
-            final_vested = int.from_bytes(data[33:41], "little")
+            # termination_type: 0=Standard, 1=ForCause, 2=Accelerated
+            schedule_raw, termination_type, final_vested = _VESTING_TERMINATED.unpack_from(data)
+            schedule_pubkey = _pubkey_str(schedule_raw)
 
             status_map = {
                 0: VestingStatus.TERMINATED_STANDARD,
@@ -401,7 +476,6 @@ class EventProcessor:
                 2: VestingStatus.TERMINATED_ACCELERATED,
             }
 
-            from sqlalchemy import update
             await session.execute(
                 update(VestingSchedule)
                 .where(VestingSchedule.pubkey == schedule_pubkey)
@@ -412,7 +486,7 @@ class EventProcessor:
                 )
             )
 
-            logger.info(
+            logger.debug(
                 "Vesting terminated",
                 schedule=schedule_pubkey[:16] + "...",
                 type=termination_type,
@@ -424,21 +498,17 @@ class EventProcessor:
     async def _handle_dividend_created(
         self,
         session: AsyncSession,
-        data: bytes,
+        data: memoryview,
         tx: Transaction,
+        ctx: _TransactionContext,
     ) -> None:
         """Handle dividend round creation"""
         try:
-            offset = 0
-            token_config = base64.b64encode(data[offset:offset + 32]).decode()
-            offset += 32
-            round_id = int.from_bytes(data[offset:offset + 8], "little")
-            offset += 8
-            payment_token = base64.b64encode(data[offset:offset + 32]).decode()
-            offset += 32
-            total_pool = int.from_bytes(data[offset:offset + 8], "little")
-            offset += 8
-            amount_per_share = int.from_bytes(data[offset:offset + 8], "little")
+            (
+                token_config_raw, round_id, payment_token_raw, total_pool, amount_per_share,
+            ) = _DIVIDEND_CREATED.unpack_from(data)
+            token_config = _pubkey_str(token_config_raw)
+            payment_token = _pubkey_str(payment_token_raw)
 
             dividend = DividendRound(
                 token_config=token_config,
@@ -447,12 +517,12 @@ class EventProcessor:
                 total_pool=total_pool,
                 amount_per_share=amount_per_share,
                 status=DividendStatus.ACTIVE,
-                created_at=tx.block_time or datetime.utcnow(),
+                created_at=ctx.timestamp,
                 created_tx=tx.signature,
             )
             session.add(dividend)
 
-            logger.info(
+            logger.debug(
                 "Dividend round created",
                 round_id=round_id,
                 total_pool=total_pool,
@@ -464,25 +534,26 @@ class EventProcessor:
     async def _handle_dividend_claimed(
         self,
         session: AsyncSession,
-        data: bytes,
+        data: memoryview,
         tx: Transaction,
+        ctx: _TransactionContext,
     ) -> None:
         """Handle dividend claim"""
         try:
-            round_pubkey = base64.b64encode(data[0:32]).decode()
-            wallet = base64.b64encode(data[32:64]).decode()
-            amount = int.from_bytes(data[64:72], "little")
+            round_raw, wallet_raw, amount = _PUBKEY_PAIR_U64.unpack_from(data)
+            round_pubkey = _pubkey_str(round_raw)
+            wallet = _pubkey_str(wallet_raw)
 
             claim = DividendClaim(
                 round_pubkey=round_pubkey,
                 wallet_address=wallet,
                 amount=amount,
-                claimed_at=tx.block_time or datetime.utcnow(),
+                claimed_at=ctx.timestamp,
                 claimed_tx=tx.signature,
             )
             session.add(claim)
 
-            logger.info(
+            logger.debug(
                 "Dividend claimed",
                 wallet=wallet[:16] + "...",
                 amount=amount,
@@ -494,25 +565,22 @@ class EventProcessor:
     async def _handle_proposal_created(
         self,
         session: AsyncSession,
-        data: bytes,
+        data: memoryview,
         tx: Transaction,
+        ctx: _TransactionContext,
     ) -> None:
         """Handle governance proposal creation"""
         try:
-            offset = 0
-            token_config = base64.b64encode(data[offset:offset + 32]).decode()
-            offset += 32
-            proposal_pubkey = base64.b64encode(data[offset:offset + 32]).decode()
-            offset += 32
-            proposal_id = int.from_bytes(data[offset:offset + 8], "little")
-            offset += 8
-            proposer = base64.b64encode(data[offset:offset + 32]).decode()
-            offset += 32
-
-            # Read title string
-            title_len = int.from_bytes(data[offset:offset + 4], "little")
-            offset += 4
-            title = data[offset:offset + title_len].decode()
+            (
+                token_config_raw, proposal_raw, proposal_id, proposer_raw, title_len,
+            ) = _PROPOSAL_CREATED.unpack_from(data)
+            token_config = _pubkey_str(token_config_raw)
+            proposal_pubkey = _pubkey_str(proposal_raw)
+            proposer = _pubkey_str(proposer_raw)
+
+            # Title string follows the fixed-width head
+            offset = _PROPOSAL_CREATED.size
+            title = str(data[offset:offset + title_len], "utf-8")
 
             proposal = Proposal(
                 pubkey=proposal_pubkey,
@@ -523,12 +591,12 @@ class EventProcessor:
                 status=ProposalStatus.ACTIVE,
                 votes_for=0,
                 votes_against=0,
-                created_at=tx.block_time or datetime.utcnow(),
+                created_at=ctx.timestamp,
                 created_tx=tx.signature,
             )
             session.add(proposal)
 
-            logger.info(
+            logger.debug(
                 "Proposal created",
                 proposal_id=proposal_id,
                 title=title[:50],
@@ -540,42 +608,31 @@ class EventProcessor:
     async def _handle_vote_cast(
         self,
         session: AsyncSession,
-        data: bytes,
+        data: memoryview,
         tx: Transaction,
+        ctx: _TransactionContext,
     ) -> None:
         """Handle governance vote"""
         try:
-            proposal_pubkey = base64.b64encode(data[0:32]).decode()
-            voter = base64.b64encode(data[32:64]).decode()
-            vote_for = data[64] == 1
-            weight = int.from_bytes(data[65:73], "little")
+            proposal_raw, voter_raw, vote_flag, weight = _VOTE_CAST.unpack_from(data)
+            proposal_pubkey = _pubkey_str(proposal_raw)
+            voter = _pubkey_str(voter_raw)
+            vote_for = vote_flag == 1
 
             vote = Vote(
                 proposal_pubkey=proposal_pubkey,
                 voter=voter,
                 vote_for=vote_for,
                 weight=weight,
-                voted_at=tx.block_time or datetime.utcnow(),
+                voted_at=ctx.timestamp,
                 voted_tx=tx.signature,
             )
             session.add(vote)
 
-            # Update proposal vote counts
-            from sqlalchemy import update
-            if vote_for:
-                await session.execute(
-                    update(Proposal)
-                    .where(Proposal.pubkey == proposal_pubkey)
-                    .values(votes_for=Proposal.votes_for + weight)
-                )
-            else:
-                await session.execute(
-                    update(Proposal)
-                    .where(Proposal.pubkey == proposal_pubkey)
-                    .values(votes_against=Proposal.votes_against + weight)
-                )
+            # Vote counts are bumped once per proposal after all events are handled
+            ctx.vote_deltas[(proposal_pubkey, vote_for)] += weight
 
-            logger.info(
+            logger.debug(
                 "Vote cast",
                 voter=voter[:16] + "...",
                 vote_for=vote_for,
@@ -588,14 +645,14 @@ class EventProcessor:
     async def _handle_proposal_executed(
         self,
         session: AsyncSession,
-        data: bytes,
+        data: memoryview,
         tx: Transaction,
+        ctx: _TransactionContext,
     ) -> None:
         """Handle proposal execution"""
         try:
-            proposal_pubkey = base64.b64encode(data[0:32]).decode()
+            proposal_pubkey = _pubkey_str(bytes(data[0:32]))
 
-            from sqlalchemy import update
             await session.execute(
                 update(Proposal)
                 .where(Proposal.pubkey == proposal_pubkey)
@@ -605,10 +662,35 @@ class EventProcessor:
                 )
             )
 
-            logger.info(
+            logger.debug(
                 "Proposal executed",
                 proposal=proposal_pubkey[:16] + "...",
             )
 
         except Exception as e:
             logger.error("Failed to decode proposal_executed event", error=str(e))
+
+    # Event type -> handler, built once with the class (called with self)
+    EVENT_HANDLERS = {
+        "token_created": _handle_token_created,
+        "allowlist_added": _handle_allowlist_added,
+        "allowlist_removed": _handle_allowlist_removed,
+        "tokens_minted": _handle_tokens_minted,
+        "tokens_transferred": _handle_tokens_transferred,
+        "vesting_created": _handle_vesting_created,
+        "vesting_released": _handle_vesting_released,
+        "vesting_terminated": _handle_vesting_terminated,
+        "dividend_created": _handle_dividend_created,
+        "dividend_claimed": _handle_dividend_claimed,
+        "proposal_created": _handle_proposal_created,
+        "vote_cast": _handle_vote_cast,
+        "proposal_executed": _handle_proposal_executed,
+    }
+
+    # Discriminator -> (event type, handler or None), so each log is routed with one lookup
+    EVENT_ROUTES = {
+        disc: (event_type, handler)
+        for (event_type, disc), handler in zip(
+            EVENT_DISCRIMINATORS.items(), map(EVENT_HANDLERS.get, EVENT_DISCRIMINATORS)
+        )
+    }
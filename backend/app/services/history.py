@@ -6,14 +6,18 @@ This service provides:
 2. Point-in-time state reconstruction
 3. Periodic snapshot creation
 """
+import asyncio
 import json
+import time
 from datetime import datetime
-from typing import Optional, Dict, Any, List, TypeVar, Type
-from sqlalchemy import select, and_, func
+from functools import lru_cache
+from typing import Optional, Dict, Any, Iterable, List, Tuple, TypeVar, Type
+from sqlalchemy import select, insert, and_, func
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import DeclarativeMeta
+from sqlalchemy.orm import DeclarativeMeta, aliased
 import structlog
 
+from app.models.database import async_session_factory, json_serializer
 from app.models.history import StateChange, ChangeType, CapTableSnapshotV2
 from app.models.token import Token
 from app.models.wallet import Wallet
@@ -26,24 +30,88 @@ logger = structlog.get_logger()
 
 T = TypeVar('T')
 
+# Batches at least this large are written with COPY instead of INSERT
+COPY_THRESHOLD = 1000
+_COPY_COLUMNS = (
+    "slot", "block_time", "entity_type", "entity_id", "token_id", "change_type",
+    "old_state", "new_state", "triggered_by", "tx_signature", "created_at",
+)
+
+# Roughly one Solana slot; a fresher slot number is of no use to history rows
+SLOT_CACHE_TTL_SECONDS = 0.4
+
+
+@lru_cache(maxsize=None)
+def _column_names(model_class: type) -> Tuple[str, ...]:
+    """Column names of a mapped class, computed once per class."""
+    return tuple(column.name for column in model_class.__table__.columns)
+
 
 def model_to_dict(obj: Any, exclude: set = None) -> Dict[str, Any]:
-    """Convert a SQLAlchemy model to a dictionary, handling datetime serialization."""
+    """Convert a SQLAlchemy model to a dictionary of column values.
+
+    Datetimes are left as-is; the engine's orjson serializer writes them as
+    ISO 8601 strings when the dict is stored in a JSON column.
+    """
     if obj is None:
         return None
 
-    exclude = exclude or set()
-    result = {}
+    exclude = exclude or ()
+    return {
+        name: getattr(obj, name)
+        for name in _column_names(type(obj))
+        if name not in exclude
+    }
+
+
+async def _fetch_all(statement) -> List[Any]:
+    """Run a read-only select on a short-lived session of its own."""
+    async with async_session_factory() as session:
+        result = await session.execute(statement)
+        return result.scalars().all()
+
+
+async def _fetch_rows(statement) -> List[Any]:
+    """Like _fetch_all, but returns the column rows of a non-entity select."""
+    async with async_session_factory() as session:
+        result = await session.execute(statement)
+        return result.all()
 
-    for column in obj.__table__.columns:
-        if column.name in exclude:
-            continue
-        value = getattr(obj, column.name)
-        if isinstance(value, datetime):
-            value = value.isoformat()
-        result[column.name] = value
 
-    return result
+class _SlotCache:
+    """Process-wide cache of the current slot and its block time.
+
+    HistoryService instances are per-session, so their own caching doesn't
+    survive across requests or indexed transactions; this one does.
+    """
+
+    def __init__(self, ttl: float = SLOT_CACHE_TTL_SECONDS):
+        self.ttl = ttl
+        self.slot: Optional[int] = None
+        self.block_time: Optional[datetime] = None
+        self.expires_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def get(self) -> Tuple[int, Optional[datetime]]:
+        if time.monotonic() < self.expires_at:
+            return self.slot, self.block_time
+
+        async with self._lock:
+            # Another waiter may have refreshed it while we queued on the lock
+            if time.monotonic() < self.expires_at:
+                return self.slot, self.block_time
+
+            solana_client = await get_solana_client()
+            slot = await solana_client.get_slot()
+            block_time = await solana_client.get_block_time(slot)
+
+            self.slot = slot
+            self.block_time = datetime.utcfromtimestamp(block_time) if block_time else None
+            self.expires_at = time.monotonic() + self.ttl
+            return self.slot, self.block_time
+
+
+_slot_cache = _SlotCache()
 
 
 class HistoryService:
@@ -53,16 +121,13 @@ class HistoryService:
         self.db = db
         self._current_slot: Optional[int] = None
         self._current_block_time: Optional[datetime] = None
+        self._pending_changes: List[Dict[str, Any]] = []
 
     async def get_current_slot(self) -> int:
         """Get the current Solana slot, caching within a request."""
         if self._current_slot is None:
             try:
-                solana_client = await get_solana_client()
-                self._current_slot = await solana_client.get_slot()
-                block_time = await solana_client.get_block_time(self._current_slot)
-                if block_time:
-                    self._current_block_time = datetime.utcfromtimestamp(block_time)
+                self._current_slot, self._current_block_time = await _slot_cache.get()
             except Exception as e:
                 logger.warning("Failed to get current slot, using 0", error=str(e))
                 self._current_slot = 0
@@ -79,10 +144,19 @@ class HistoryService:
         triggered_by: Optional[str] = None,
         tx_signature: Optional[str] = None,
         slot: Optional[int] = None,
-    ) -> StateChange:
+        block_time: Optional[datetime] = None,
+        flush: bool = True,
+    ) -> Optional[StateChange]:
         """
         Record a state change event.
 
+        With flush=False the change is only queued and None is returned;
+        queued changes are written in one INSERT by flush_pending().
+
+        For an UPDATE with both states, old_state is trimmed to the columns
+        that changed and nothing is recorded (None is returned) if none did.
+        new_state stays complete so the latest change alone gives the state.
+
         Args:
             entity_type: Type of entity (e.g., "wallet", "token", "share_position")
             entity_id: Primary key or composite key as string
@@ -93,25 +167,43 @@ class HistoryService:
             triggered_by: What caused this change
             tx_signature: Solana transaction signature if applicable
             slot: Specific slot (defaults to current)
+            block_time: Block time of the slot, if the caller already has it
+            flush: Insert immediately (False queues it for flush_pending)
         """
+        if change_type == ChangeType.UPDATE and old_state is not None and new_state is not None:
+            old_state = {
+                key: old_state.get(key)
+                for key, value in new_state.items()
+                if old_state.get(key) != value
+            }
+            if not old_state:
+                return None
+
         if slot is None:
             slot = await self.get_current_slot()
+        if block_time is None:
+            block_time = self._current_block_time
 
-        change = StateChange(
-            slot=slot,
-            block_time=self._current_block_time,
-            entity_type=entity_type,
-            entity_id=entity_id,
-            token_id=token_id,
-            change_type=change_type,
-            old_state=old_state,
-            new_state=new_state,
-            triggered_by=triggered_by,
-            tx_signature=tx_signature,
-        )
-
-        self.db.add(change)
-        await self.db.flush()
+        row = {
+            "slot": slot,
+            "block_time": block_time,
+            "entity_type": entity_type,
+            "entity_id": entity_id,
+            "token_id": token_id,
+            "change_type": change_type,
+            "old_state": old_state,
+            "new_state": new_state,
+            "triggered_by": triggered_by,
+            "tx_signature": tx_signature,
+        }
+
+        change = None
+        if flush:
+            change = StateChange(**row)
+            self.db.add(change)
+            await self.db.flush()
+        else:
+            self._pending_changes.append(row)
 
         logger.info(
             "Recorded state change",
@@ -123,6 +215,54 @@ class HistoryService:
 
         return change
 
+    async def record_changes_bulk(self, changes: List[Dict[str, Any]]) -> None:
+        """Insert many StateChange rows (dicts of column values) in one statement."""
+        if not changes:
+            return
+        if len(changes) >= COPY_THRESHOLD:
+            await self.copy_changes(changes)
+            return
+        await self.db.execute(insert(StateChange), changes)
+
+    async def copy_changes(self, changes: Iterable[Dict[str, Any]]) -> None:
+        """
+        Bulk-load StateChange rows with the COPY protocol (asyncpg only).
+
+        Values bypass SQLAlchemy's type processing, so they are converted here
+        the way the column types would: the enum by name, JSONB as text.
+        """
+        created_at = datetime.utcnow()
+        records = [
+            (
+                change["slot"],
+                change["block_time"],
+                change["entity_type"],
+                change["entity_id"],
+                change["token_id"],
+                change["change_type"].name,
+                None if change["old_state"] is None else json_serializer(change["old_state"]),
+                None if change["new_state"] is None else json_serializer(change["new_state"]),
+                change["triggered_by"],
+                change["tx_signature"],
+                created_at,
+            )
+            for change in changes
+        ]
+
+        connection = await self.db.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            StateChange.__tablename__,
+            records=records,
+            columns=_COPY_COLUMNS,
+        )
+
+    async def flush_pending(self) -> int:
+        """Write all changes queued with flush=False, returning how many were written."""
+        pending, self._pending_changes = self._pending_changes, []
+        await self.record_changes_bulk(pending)
+        return len(pending)
+
     async def record_model_change(
         self,
         model: Any,
@@ -131,7 +271,8 @@ class HistoryService:
         triggered_by: Optional[str] = None,
         tx_signature: Optional[str] = None,
         slot: Optional[int] = None,
-    ) -> StateChange:
+        flush: bool = True,
+    ) -> Optional[StateChange]:
         """
         Convenience method to record a change for a SQLAlchemy model.
 
@@ -142,6 +283,7 @@ class HistoryService:
             triggered_by: What caused this change
             tx_signature: Solana transaction signature if applicable
             slot: Specific slot (defaults to current)
+            flush: Insert immediately (False queues it for flush_pending)
         """
         # Determine entity type from model class
         entity_type = model.__class__.__tablename__
@@ -171,6 +313,7 @@ class HistoryService:
             triggered_by=triggered_by,
             tx_signature=tx_signature,
             slot=slot,
+            flush=flush,
         )
 
     async def get_state_at_slot(
@@ -217,15 +360,12 @@ class HistoryService:
         """
         Get all entities of a type for a token at a specific slot.
 
-        This uses a subquery to find the most recent change for each entity_id
-        before the target slot.
+        Uses DISTINCT ON (entity_id) ordered by slot descending, so the most
+        recent change per entity comes out of a single index scan rather than
+        a max(slot) aggregate joined back onto the table.
         """
-        # Subquery to get max slot for each entity before target
-        subq = (
-            select(
-                StateChange.entity_id,
-                func.max(StateChange.slot).label('max_slot')
-            )
+        latest = (
+            select(StateChange)
             .where(
                 and_(
                     StateChange.entity_type == entity_type,
@@ -233,25 +373,18 @@ class HistoryService:
                     StateChange.slot <= slot,
                 )
             )
-            .group_by(StateChange.entity_id)
+            .order_by(StateChange.entity_id, StateChange.slot.desc(), StateChange.id.desc())
+            .distinct(StateChange.entity_id)
             .subquery()
         )
+        latest_change = aliased(StateChange, latest)
 
-        # Join to get the actual records
+        # Entities whose most recent change is a DELETE didn't exist at this slot
         result = await self.db.execute(
-            select(StateChange)
-            .join(
-                subq,
+            select(latest_change).where(
                 and_(
-                    StateChange.entity_id == subq.c.entity_id,
-                    StateChange.slot == subq.c.max_slot,
-                )
-            )
-            .where(
-                and_(
-                    StateChange.entity_type == entity_type,
-                    StateChange.token_id == token_id,
-                    StateChange.change_type != ChangeType.DELETE,
+                    latest_change.change_type != ChangeType.DELETE,
+                    latest_change.new_state.isnot(None),
                 )
             )
         )
@@ -268,7 +401,9 @@ class HistoryService:
         """
         Create a complete point-in-time snapshot for a token.
 
-        This captures all relevant state for full reconstruction.
+        This captures all relevant state for full reconstruction. Holder,
+        position, class and vesting rows are read on separate sessions, so
+        pending writes must be committed before calling this.
         """
         block_time = None
         if slot is None:
@@ -297,56 +432,55 @@ class HistoryService:
         if not token:
             raise ValueError(f"Token {token_id} not found")
 
-        # Get all wallets for this token
-        result = await self.db.execute(
-            select(Wallet).where(Wallet.token_id == token_id)
-        )
-        wallets = result.scalars().all()
-
-        # Get all current balances
-        result = await self.db.execute(
-            select(CurrentBalance)
-            .where(CurrentBalance.token_id == token_id)
-            .where(CurrentBalance.balance > 0)
-        )
-        balances = result.scalars().all()
-
-        # Get all share positions
-        result = await self.db.execute(
-            select(SharePosition)
-            .where(SharePosition.token_id == token_id)
-            .where(SharePosition.shares > 0)
-        )
-        share_positions = result.scalars().all()
-
-        # Get all share classes
-        result = await self.db.execute(
-            select(ShareClass).where(ShareClass.token_id == token_id)
-        )
-        share_classes = result.scalars().all()
-
-        # Get all vesting schedules
-        result = await self.db.execute(
-            select(VestingSchedule).where(VestingSchedule.token_id == token_id)
+        # The remaining reads are independent, so run them concurrently on
+        # their own sessions (an AsyncSession can't run statements in parallel).
+        # Everything but vesting (which needs calculate_vested) is selected as
+        # plain column rows, skipping ORM instance construction. Wallet status
+        # is joined in, so only wallets that hold something are read.
+        wallet_status = func.coalesce(Wallet.status, "unknown").label("status")
+        balances, share_positions, share_classes, vesting_schedules = await asyncio.gather(
+            _fetch_rows(
+                select(CurrentBalance.wallet, CurrentBalance.balance, wallet_status)
+                .outerjoin(
+                    Wallet,
+                    and_(Wallet.token_id == token_id, Wallet.address == CurrentBalance.wallet),
+                )
+                .where(CurrentBalance.token_id == token_id)
+                .where(CurrentBalance.balance > 0)
+            ),
+            _fetch_rows(
+                select(
+                    SharePosition.id,
+                    SharePosition.wallet,
+                    SharePosition.share_class_id,
+                    SharePosition.shares,
+                    SharePosition.cost_basis,
+                    SharePosition.price_per_share,
+                    wallet_status,
+                )
+                .outerjoin(
+                    Wallet,
+                    and_(Wallet.token_id == token_id, Wallet.address == SharePosition.wallet),
+                )
+                .where(SharePosition.token_id == token_id)
+                .where(SharePosition.shares > 0)
+            ),
+            _fetch_rows(
+                select(
+                    ShareClass.id,
+                    ShareClass.name,
+                    ShareClass.symbol,
+                    ShareClass.priority,
+                    ShareClass.preference_multiple,
+                ).where(ShareClass.token_id == token_id)
+            ),
+            _fetch_all(select(VestingSchedule).where(VestingSchedule.token_id == token_id)),
         )
-        vesting_schedules = result.scalars().all()
-
-        # Build wallet status map
-        wallet_status_map = {w.address: w.status for w in wallets}
 
         # Build holders list from both token balances AND share positions
         # Combine unique wallets from both sources
-        holders = []
-        holder_wallets = set()
-
-        # Add token balance holders
-        for b in balances:
-            holders.append({
-                "wallet": b.wallet,
-                "balance": b.balance,
-                "status": wallet_status_map.get(b.wallet, "unknown"),
-            })
-            holder_wallets.add(b.wallet)
+        holders = [dict(b._mapping) for b in balances]
+        holder_wallets = {b.wallet for b in balances}
 
         # Add share position holders (if not already counted)
         for sp in share_positions:
@@ -354,21 +488,22 @@ class HistoryService:
                 holders.append({
                     "wallet": sp.wallet,
                     "balance": 0,  # No token balance, but has share position
-                    "status": wallet_status_map.get(sp.wallet, "unknown"),
+                    "status": sp.status,
                 })
                 holder_wallets.add(sp.wallet)
 
         # Build share positions list
-        positions_data = []
-        for sp in share_positions:
-            positions_data.append({
+        positions_data = [
+            {
                 "id": sp.id,
                 "wallet": sp.wallet,
                 "share_class_id": sp.share_class_id,
                 "shares": sp.shares,
                 "cost_basis": sp.cost_basis,
                 "price_per_share": sp.price_per_share,
-            })
+            }
+            for sp in share_positions
+        ]
 
         # Build vesting data with calculated values
         vesting_data = []
@@ -382,23 +517,15 @@ class HistoryService:
                 "released_amount": vs.released_amount,
                 "vested_amount": vested,
                 "unvested_amount": vs.total_amount - vested,
-                "start_time": vs.start_time.isoformat() if vs.start_time else None,
-                "cliff_duration": vs.cliff_duration,
-                "total_duration": vs.total_duration,
+                "start_time": vs.start_time,
+                "cliff_duration": vs.cliff_seconds,
+                "total_duration": vs.duration_seconds,
                 "revoked": vs.revoked,
                 "termination_type": vs.termination_type,
             })
 
-        # Build share classes data
-        classes_data = []
-        for sc in share_classes:
-            classes_data.append({
-                "id": sc.id,
-                "name": sc.name,
-                "symbol": sc.symbol,
-                "priority": sc.priority,
-                "preference_multiple": float(sc.preference_multiple),
-            })
+        # Build share classes data (preference_multiple is a Float column)
+        classes_data = [dict(sc._mapping) for sc in share_classes]
 
         # Create snapshot
         snapshot = CapTableSnapshotV2(
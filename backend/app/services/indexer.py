@@ -1,19 +1,32 @@
 """Solana Transaction Indexer for ChainEquity"""
 import asyncio
-from typing import Optional, Dict, Any, Set
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, Set
 from datetime import datetime
 import structlog
+from solders.pubkey import Pubkey
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import get_settings
 from app.services.solana_client import SolanaClient, get_solana_client
 from app.services.event_processor import EventProcessor
-from app.models.database import async_session_maker
-from app.models.transaction import Transaction, TransactionStatus
+from app.models.database import async_session_factory
+from app.models.transaction import Transaction, IndexerCursor
 
 logger = structlog.get_logger()
 settings = get_settings()
 
+# How many recently processed signatures to remember for de-duplication
+MAX_PROCESSED_SIGNATURES = 10000
+# Safety-net poll interval while a logs subscription is live
+SUBSCRIBED_POLL_INTERVAL = 30.0
+# Slots of already-stored signatures to preload into the de-dup set on start
+RESUME_SLOT_WINDOW = 1000
+# Polls a failing transaction is retried in before the cursor moves past it
+MAX_TRANSACTION_ATTEMPTS = 5
+
 
 class TransactionIndexer:
     """
@@ -38,15 +51,25 @@ class TransactionIndexer:
         self.event_processor = EventProcessor()
         self._running = False
         self._last_signatures: Dict[str, Optional[str]] = {}
-        self._processed_signatures: Set[str] = set()
-
-    @property
-    async def client(self) -> SolanaClient:
-        """Get Solana client"""
+        self._subscribed: Set[str] = set()
+        # Insertion-ordered so the oldest signatures can be evicted in O(1)
+        self._processed_signatures: OrderedDict[str, None] = OrderedDict()
+        # Failed attempts per signature still holding a cursor back
+        self._failed_attempts: Dict[str, int] = {}
+
+    async def _ensure_client(self) -> SolanaClient:
+        """Resolve the Solana client once; entry points call this, helpers use self._client"""
         if self._client is None:
             self._client = await get_solana_client()
         return self._client
 
+    def _mark_processed(self, signature: str) -> None:
+        """Remember a signature, evicting the oldest once over the bound"""
+        self._processed_signatures[signature] = None
+        self._processed_signatures.move_to_end(signature)
+        while len(self._processed_signatures) > MAX_PROCESSED_SIGNATURES:
+            self._processed_signatures.popitem(last=False)
+
     async def start(self) -> None:
         """Start the indexer"""
         if self._running:
@@ -56,6 +79,9 @@ class TransactionIndexer:
         self._running = True
         logger.info("Starting transaction indexer", poll_interval=self.poll_interval)
 
+        await self._ensure_client()
+        await self._load_cursors()
+
         # Start polling tasks for each program
         await asyncio.gather(
             self._poll_program("factory"),
@@ -68,96 +94,261 @@ class TransactionIndexer:
         self._running = False
         logger.info("Stopping transaction indexer")
 
+    async def _load_cursors(self) -> None:
+        """Resume from the persisted per-program cursors, if any"""
+        async with async_session_factory() as session:
+            result = await session.execute(select(IndexerCursor))
+            cursors = result.scalars().all()
+            if not cursors:
+                return
+
+            for cursor in cursors:
+                self._last_signatures[cursor.program] = cursor.last_signature
+
+            # Signatures stored just before the cursors are the likeliest repeats
+            min_slot = max(cursor.slot for cursor in cursors) - RESUME_SLOT_WINDOW
+            result = await session.execute(
+                select(Transaction.signature)
+                .where(Transaction.slot >= min_slot)
+                .order_by(Transaction.slot)
+            )
+            for signature in result.scalars():
+                self._mark_processed(signature)
+
+        logger.info("Resumed indexer cursors", programs=[c.program for c in cursors])
+
+    async def _save_cursor(
+        self,
+        session: AsyncSession,
+        program_name: str,
+        sig_info: Dict[str, Any],
+    ) -> None:
+        """Upsert the program's cursor to the newest signature of a batch"""
+        stmt = pg_insert(IndexerCursor).values(
+            program=program_name,
+            last_signature=sig_info["signature"],
+            slot=sig_info["slot"],
+            updated_at=datetime.utcnow(),
+        )
+        await session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["program"],
+                set_={
+                    "last_signature": stmt.excluded.last_signature,
+                    "slot": stmt.excluded.slot,
+                    "updated_at": stmt.excluded.updated_at,
+                },
+            )
+        )
+
     async def _poll_program(self, program_name: str) -> None:
-        """Poll a program for new transactions"""
-        client = await self.client
+        """
+        Index a program's new transactions as they arrive.
+
+        A logsSubscribe listener wakes the poller as soon as a transaction
+        mentions the program, so an idle program costs no RPC calls. Each
+        wake-up runs one signature poll bounded by the last seen signature,
+        which also backfills anything missed while the websocket was down.
+        While unsubscribed it falls back to polling every poll_interval.
+        """
+        client = self._client
         program_id = getattr(client.program_addresses, program_name)
 
         logger.info(f"Starting to poll {program_name} program", address=str(program_id))
 
+        wake = asyncio.Event()
+        listener = asyncio.create_task(self._listen_program(program_name, program_id, wake))
+        try:
+            while self._running:
+                wake.clear()
+                await self._poll_once(program_name, program_id)
+
+                interval = (
+                    SUBSCRIBED_POLL_INTERVAL
+                    if program_name in self._subscribed
+                    else self.poll_interval
+                )
+                try:
+                    await asyncio.wait_for(wake.wait(), timeout=interval)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            listener.cancel()
+
+    async def _listen_program(
+        self,
+        program_name: str,
+        program_id: Pubkey,
+        wake: asyncio.Event,
+    ) -> None:
+        """Set wake whenever a transaction mentioning the program is confirmed"""
+        client = self._client
+
         while self._running:
+            self._subscribed.add(program_name)
             try:
-                # Get recent signatures
-                last_sig = self._last_signatures.get(program_name)
-                signatures = await client.get_signatures_for_address(
-                    program_id,
-                    until=last_sig,
-                    limit=self.batch_size,
+                async for _ in client.logs_subscribe(program_id):
+                    wake.set()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(
+                    f"Log subscription for {program_name} dropped, polling instead",
+                    error=str(e),
                 )
+            finally:
+                self._subscribed.discard(program_name)
 
-                if signatures:
-                    # Process in reverse (oldest first)
-                    for sig_info in reversed(signatures):
-                        sig = sig_info["signature"]
+            # Catch up on anything missed, then resubscribe
+            wake.set()
+            await asyncio.sleep(self.poll_interval)
 
-                        # Skip if already processed
-                        if sig in self._processed_signatures:
-                            continue
+    async def _poll_once(self, program_name: str, program_id: Pubkey) -> None:
+        """Index the program's signatures newer than the last one seen"""
+        client = self._client
+
+        try:
+            # Get recent signatures
+            last_sig = self._last_signatures.get(program_name)
+            signatures = await client.get_signatures_for_address(
+                program_id,
+                until=last_sig,
+                limit=self.batch_size,
+            )
 
-                        # Skip failed transactions
-                        if sig_info.get("err"):
-                            self._processed_signatures.add(sig)
-                            continue
+            if signatures:
+                # Oldest first, skipping already processed and failed ones
+                pending = []
+                for sig_info in reversed(signatures):
+                    sig = sig_info["signature"]
+                    if sig in self._processed_signatures:
+                        continue
+                    if sig_info.get("err"):
+                        self._mark_processed(sig)
+                        continue
+                    pending.append(sig_info)
+
+                # Fetch concurrently, but store and apply events in order,
+                # committing the whole batch once
+                tx_datas = await self._fetch_transactions(
+                    [sig_info["signature"] for sig_info in pending]
+                )
+                succeeded: Dict[str, bool] = {}
+                async with async_session_factory() as session:
+                    for sig_info, tx_data in zip(pending, tx_datas):
+                        ok = await self._process_transaction(session, program_name, sig_info, tx_data)
+                        if not ok and self._record_failure(sig_info):
+                            ok = True  # Retries exhausted - let the cursor move past it
+                        succeeded[sig_info["signature"]] = ok
+
+                    # Advance the cursor only through the oldest-first run of
+                    # signatures that succeeded, so failures are retried
+                    cursor = None
+                    for sig_info in reversed(signatures):
+                        if not succeeded.get(sig_info["signature"], True):
+                            break
+                        cursor = sig_info
+                    if cursor is not None:
+                        await self._save_cursor(session, program_name, cursor)
+                    await session.commit()
 
-                        await self._process_transaction(program_name, sig_info)
-                        self._processed_signatures.add(sig)
+                for signature, ok in succeeded.items():
+                    if ok:
+                        self._failed_attempts.pop(signature, None)
+                        self._mark_processed(signature)
 
-                    # Update last signature
-                    self._last_signatures[program_name] = signatures[0]["signature"]
+                if cursor is not None:
+                    self._last_signatures[program_name] = cursor["signature"]
 
-                    # Keep processed set bounded
-                    if len(self._processed_signatures) > 10000:
-                        # Remove oldest entries
-                        self._processed_signatures = set(
-                            list(self._processed_signatures)[-5000:]
-                        )
+        except Exception as e:
+            logger.error(
+                f"Error polling {program_name}",
+                error=str(e),
+                exc_info=True,
+            )
 
-            except Exception as e:
-                logger.error(
-                    f"Error polling {program_name}",
-                    error=str(e),
-                    exc_info=True,
-                )
+    def _record_failure(self, sig_info: Dict[str, Any]) -> bool:
+        """
+        Count a failed attempt at a transaction. Returns True (and logs it)
+        once it has failed MAX_TRANSACTION_ATTEMPTS times, so the cursor can
+        move past it instead of re-fetching everything after it forever.
+        """
+        signature = sig_info["signature"]
+        attempts = self._failed_attempts.get(signature, 0) + 1
+        if attempts < MAX_TRANSACTION_ATTEMPTS:
+            self._failed_attempts[signature] = attempts
+            return False
+
+        self._failed_attempts.pop(signature, None)
+        logger.error(
+            "Giving up on transaction",
+            signature=signature,
+            slot=sig_info["slot"],
+            attempts=attempts,
+        )
+        return True
 
-            await asyncio.sleep(self.poll_interval)
+    async def _fetch_transactions(
+        self,
+        signatures: List[str],
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Fetch full transactions concurrently (bounded by the client's RPC
+        semaphore). A failed fetch yields None so _process_transaction retries it.
+        """
+        return await self._client.get_transactions_batch(signatures)
 
     async def _process_transaction(
         self,
+        session: AsyncSession,
         program_name: str,
         sig_info: Dict[str, Any],
-    ) -> None:
-        """Process a single transaction"""
+        tx_data: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """
+        Process a single transaction, fetching it unless tx_data is given.
+        Runs in a savepoint on the batch session, so a failure only discards
+        this transaction's writes; the caller commits.
+
+        Returns False if the transaction should be retried (not found or
+        failed), True once it is stored - including by an earlier run.
+        """
         signature = sig_info["signature"]
-        client = await self.client
 
         try:
             # Fetch full transaction
-            tx_data = await client.get_transaction(signature)
+            if tx_data is None:
+                tx_data = await self._client.get_transaction(signature)
             if tx_data is None:
                 logger.warning("Transaction not found", signature=signature)
-                return
+                return False
+
+            program_id = getattr(self._client.program_addresses, program_name)
+            values = {
+                "signature": signature,
+                "program_id": str(program_id),
+                "slot": sig_info["slot"],
+                "block_time": datetime.fromtimestamp(sig_info["block_time"])
+                if sig_info.get("block_time")
+                else None,
+                "status": "success",
+            }
 
             # Parse and store transaction
-            async with async_session_maker() as session:
-                # Check if already stored
-                existing = await session.get(Transaction, signature)
-                if existing:
-                    return
-
-                # Create transaction record
-                tx = Transaction(
-                    signature=signature,
-                    program=program_name,
-                    slot=sig_info["slot"],
-                    block_time=datetime.fromtimestamp(sig_info["block_time"])
-                    if sig_info.get("block_time")
-                    else None,
-                    status=TransactionStatus.CONFIRMED,
-                    raw_data=tx_data,
+            async with session.begin_nested():
+                # Insert unless already stored - one round trip, and safe
+                # against another indexer inserting the same signature
+                result = await session.execute(
+                    pg_insert(Transaction)
+                    .values(**values)
+                    .on_conflict_do_nothing(index_elements=["signature"])
+                    .returning(Transaction.signature)
                 )
+                if result.scalar_one_or_none() is None:
+                    return True
 
-                session.add(tx)
-                await session.commit()
+                # Transient record for the event processor (row inserted above)
+                tx = Transaction(**values)
 
                 logger.debug(
                     "Indexed transaction",
@@ -180,6 +371,9 @@ class TransactionIndexer:
                 error=str(e),
                 exc_info=True,
             )
+            return False
+
+        return True
 
     async def backfill(
         self,
@@ -192,7 +386,7 @@ class TransactionIndexer:
         Backfill historical transactions for a program.
         Returns number of transactions processed.
         """
-        client = await self.client
+        client = await self._ensure_client()
         program_id = getattr(client.program_addresses, program_name)
 
         logger.info(
@@ -214,17 +408,20 @@ class TransactionIndexer:
             if not signatures:
                 break
 
-            for sig_info in signatures:
-                # Check slot bounds
-                if from_slot and sig_info["slot"] < from_slot:
-                    return processed
-                if to_slot and sig_info["slot"] > to_slot:
-                    continue
-
-                if sig_info["signature"] not in self._processed_signatures:
-                    await self._process_transaction(program_name, sig_info)
-                    self._processed_signatures.add(sig_info["signature"])
-                    processed += 1
+            async with async_session_factory() as session:
+                for sig_info in signatures:
+                    # Check slot bounds
+                    if from_slot and sig_info["slot"] < from_slot:
+                        await session.commit()
+                        return processed
+                    if to_slot and sig_info["slot"] > to_slot:
+                        continue
+
+                    if sig_info["signature"] not in self._processed_signatures:
+                        if await self._process_transaction(session, program_name, sig_info):
+                            self._mark_processed(sig_info["signature"])
+                            processed += 1
+                await session.commit()
 
             before = signatures[-1]["signature"]
 
@@ -233,7 +430,7 @@ class TransactionIndexer:
 
     async def get_sync_status(self) -> Dict[str, Any]:
         """Get indexer sync status"""
-        client = await self.client
+        client = await self._ensure_client()
         current_slot = await client.get_slot()
 
         return {
@@ -1,10 +1,14 @@
 """Solana RPC Client wrapper for ChainEquity"""
 import asyncio
-from typing import Optional, List, Dict, Any
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, AsyncIterator, Union
 from dataclasses import dataclass
 import structlog
 from solana.rpc.async_api import AsyncClient
 from solana.rpc.commitment import Commitment, Confirmed, Finalized
+from solana.rpc.types import MemcmpOpts
+from solana.rpc.websocket_api import connect as ws_connect
+from solders.rpc.config import RpcTransactionLogsFilterMentions
 from solders.pubkey import Pubkey
 from solders.signature import Signature
 from anchorpy import Program, Provider, Wallet
@@ -14,6 +18,9 @@ from app.config import get_settings
 logger = structlog.get_logger()
 settings = get_settings()
 
+# getMultipleAccounts accepts at most this many pubkeys per request
+MULTIPLE_ACCOUNTS_LIMIT = 100
+
 
 @dataclass
 class ProgramAddresses:
@@ -24,13 +31,82 @@ class ProgramAddresses:
     test_usdc: Pubkey
 
 
+@lru_cache(maxsize=8192)
+def _find_program_address(program_id: Pubkey, *seeds: bytes) -> tuple[Pubkey, int]:
+    """Memoized Pubkey.find_program_address - the bump search hashes seeds up to 256 times"""
+    return Pubkey.find_program_address(list(seeds), program_id)
+
+
+def _account_to_dict(account) -> Optional[Dict[str, Any]]:
+    """Convert an RPC account (or None) to the dict shape returned by SolanaClient"""
+    if account is None:
+        return None
+    return {
+        "lamports": account.lamports,
+        "owner": str(account.owner),
+        "data": account.data,
+        "executable": account.executable,
+        "rent_epoch": account.rent_epoch,
+    }
+
+
+class AccountLoader:
+    """
+    Coalesces account lookups made in the same event-loop tick into
+    getMultipleAccounts requests. Concurrent loads of one address share
+    a single future.
+    """
+
+    def __init__(self, client: "SolanaClient"):
+        self._client = client
+        self._pending: Dict[Pubkey, asyncio.Future] = {}
+        self._tasks: set = set()
+
+    async def load(self, address: Pubkey) -> Optional[Dict[str, Any]]:
+        """Get account info for an address, batched with other loads this tick"""
+        future = self._pending.get(address)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            if not self._pending:
+                loop.call_soon(self._dispatch)
+            future = loop.create_future()
+            self._pending[address] = future
+        # Shielded so one cancelled caller doesn't fail the others sharing it
+        return await asyncio.shield(future)
+
+    def _dispatch(self) -> None:
+        pending, self._pending = self._pending, {}
+        task = asyncio.ensure_future(self._fetch(pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _fetch(self, pending: Dict[Pubkey, asyncio.Future]) -> None:
+        addresses = list(pending)
+        try:
+            accounts = await self._client.get_accounts_batch(addresses)
+        except Exception as e:
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for address, account in zip(addresses, accounts):
+            future = pending[address]
+            if not future.done():
+                future.set_result(account)
+
+
 class SolanaClient:
     """Async Solana RPC client with program interaction support"""
 
-    def __init__(self, rpc_url: Optional[str] = None):
+    def __init__(self, rpc_url: Optional[str] = None, ws_url: Optional[str] = None):
         self.rpc_url = rpc_url or settings.solana_rpc_url
+        self.ws_url = ws_url or settings.solana_ws_url
         self._client: Optional[AsyncClient] = None
         self._programs: Dict[str, Program] = {}
+        # Bounds in-flight RPC requests so batch fan-out stays under the
+        # node's per-IP rate limit
+        self._semaphore = asyncio.Semaphore(settings.rpc_concurrency)
+        self.account_loader = AccountLoader(self)
 
         # Program IDs from settings
         self.program_addresses = ProgramAddresses(
@@ -62,12 +138,14 @@ class SolanaClient:
 
     async def get_slot(self) -> int:
         """Get current slot"""
-        response = await self.client.get_slot(commitment=Confirmed)
+        async with self._semaphore:
+            response = await self.client.get_slot(commitment=Confirmed)
         return response.value
 
     async def get_block_time(self, slot: int) -> Optional[int]:
         """Get block time for a slot"""
-        response = await self.client.get_block_time(slot)
+        async with self._semaphore:
+            response = await self.client.get_block_time(slot)
         return response.value
 
     async def get_signatures_for_address(
@@ -78,13 +156,14 @@ class SolanaClient:
         limit: int = 1000,
     ) -> List[Dict[str, Any]]:
         """Get transaction signatures for an address"""
-        response = await self.client.get_signatures_for_address(
-            address,
-            before=before,
-            until=until,
-            limit=limit,
-            commitment=Confirmed,
-        )
+        async with self._semaphore:
+            response = await self.client.get_signatures_for_address(
+                address,
+                before=before,
+                until=until,
+                limit=limit,
+                commitment=Confirmed,
+            )
         return [
             {
                 "signature": str(sig.signature),
@@ -96,6 +175,28 @@ class SolanaClient:
             for sig in response.value
         ]
 
+    async def logs_subscribe(self, address: Pubkey) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream transactions that mention an address, as they are confirmed.
+        Yields dicts shaped like get_signatures_for_address entries; the
+        websocket closes when the consumer stops iterating.
+        """
+        async with ws_connect(self.ws_url) as websocket:
+            await websocket.logs_subscribe(
+                RpcTransactionLogsFilterMentions(address),
+                commitment=Confirmed,
+            )
+            await websocket.recv()  # Subscription confirmation
+
+            async for messages in websocket:
+                for message in messages:
+                    yield {
+                        "signature": str(message.result.value.signature),
+                        "slot": message.result.context.slot,
+                        "err": message.result.value.err,
+                        "block_time": None,
+                    }
+
     async def get_transaction(
         self,
         signature: str,
@@ -103,48 +204,81 @@ class SolanaClient:
     ) -> Optional[Dict[str, Any]]:
         """Get transaction details"""
         sig = Signature.from_string(signature)
-        response = await self.client.get_transaction(
-            sig,
-            encoding="jsonParsed",
-            commitment=Finalized,
-            max_supported_transaction_version=max_supported_version,
-        )
+        async with self._semaphore:
+            response = await self.client.get_transaction(
+                sig,
+                encoding="jsonParsed",
+                commitment=Finalized,
+                max_supported_transaction_version=max_supported_version,
+            )
         if response.value is None:
             return None
         return response.value.to_json()
 
+    async def get_transactions_batch(
+        self,
+        signatures: List[str],
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Fetch transactions concurrently, in input order. A failed fetch
+        yields None; concurrency is bounded by the client semaphore.
+        """
+        results = await asyncio.gather(
+            *(self.get_transaction(signature) for signature in signatures),
+            return_exceptions=True,
+        )
+        return [None if isinstance(r, Exception) else r for r in results]
+
     async def get_account_info(
         self,
         address: Pubkey,
     ) -> Optional[Dict[str, Any]]:
         """Get account info"""
-        response = await self.client.get_account_info(
-            address,
-            commitment=Confirmed,
-            encoding="base64",
-        )
-        if response.value is None:
-            return None
-        return {
-            "lamports": response.value.lamports,
-            "owner": str(response.value.owner),
-            "data": response.value.data,
-            "executable": response.value.executable,
-            "rent_epoch": response.value.rent_epoch,
-        }
+        async with self._semaphore:
+            response = await self.client.get_account_info(
+                address,
+                commitment=Confirmed,
+                encoding="base64",
+            )
+        return _account_to_dict(response.value)
+
+    async def get_accounts_batch(
+        self,
+        addresses: List[Pubkey],
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Get account info for many addresses, in input order (None for
+        missing accounts). Uses getMultipleAccounts, one request per
+        MULTIPLE_ACCOUNTS_LIMIT addresses.
+        """
+        async def fetch_chunk(chunk: List[Pubkey]) -> List[Optional[Dict[str, Any]]]:
+            async with self._semaphore:
+                response = await self.client.get_multiple_accounts(
+                    chunk,
+                    commitment=Confirmed,
+                    encoding="base64",
+                )
+            return [_account_to_dict(account) for account in response.value]
+
+        chunks = await asyncio.gather(*(
+            fetch_chunk(addresses[i:i + MULTIPLE_ACCOUNTS_LIMIT])
+            for i in range(0, len(addresses), MULTIPLE_ACCOUNTS_LIMIT)
+        ))
+        return [account for chunk in chunks for account in chunk]
 
     async def get_program_accounts(
         self,
         program_id: Pubkey,
-        filters: Optional[List[Dict]] = None,
+        filters: Optional[List[Union[int, MemcmpOpts]]] = None,
     ) -> List[Dict[str, Any]]:
         """Get all accounts owned by a program"""
-        response = await self.client.get_program_accounts(
-            program_id,
-            commitment=Confirmed,
-            encoding="base64",
-            filters=filters,
-        )
+        async with self._semaphore:
+            response = await self.client.get_program_accounts(
+                program_id,
+                commitment=Confirmed,
+                encoding="base64",
+                filters=filters,
+            )
         return [
             {
                 "pubkey": str(account.pubkey),
@@ -171,12 +305,13 @@ class SolanaClient:
         else:
             opts = {"programId": token_program}
 
-        response = await self.client.get_token_accounts_by_owner(
-            owner,
-            opts,
-            commitment=Confirmed,
-            encoding="jsonParsed",
-        )
+        async with self._semaphore:
+            response = await self.client.get_token_accounts_by_owner(
+                owner,
+                opts,
+                commitment=Confirmed,
+                encoding="jsonParsed",
+            )
         return [
             {
                 "pubkey": str(account.pubkey),
@@ -190,10 +325,11 @@ class SolanaClient:
         token_account: Pubkey,
     ) -> Dict[str, Any]:
         """Get token account balance"""
-        response = await self.client.get_token_account_balance(
-            token_account,
-            commitment=Confirmed,
-        )
+        async with self._semaphore:
+            response = await self.client.get_token_account_balance(
+                token_account,
+                commitment=Confirmed,
+            )
         return {
             "amount": response.value.amount,
             "decimals": response.value.decimals,
@@ -203,58 +339,64 @@ class SolanaClient:
     # PDA derivation helpers
     def derive_factory_pda(self) -> tuple[Pubkey, int]:
         """Derive factory PDA"""
-        return Pubkey.find_program_address(
-            [b"factory"],
+        return _find_program_address(
             self.program_addresses.factory,
+            b"factory",
         )
 
     def derive_token_config_pda(self, mint: Pubkey) -> tuple[Pubkey, int]:
         """Derive token config PDA"""
-        return Pubkey.find_program_address(
-            [b"token_config", bytes(mint)],
+        return _find_program_address(
             self.program_addresses.factory,
+            b"token_config",
+            bytes(mint),
         )
 
     def derive_allowlist_pda(self, token_config: Pubkey, wallet: Pubkey) -> tuple[Pubkey, int]:
         """Derive allowlist entry PDA"""
-        return Pubkey.find_program_address(
-            [b"allowlist", bytes(token_config), bytes(wallet)],
+        return _find_program_address(
             self.program_addresses.token,
+            b"allowlist",
+            bytes(token_config),
+            bytes(wallet),
         )
 
     def derive_vesting_pda(
         self, token_config: Pubkey, beneficiary: Pubkey, start_time: int
     ) -> tuple[Pubkey, int]:
         """Derive vesting schedule PDA"""
-        return Pubkey.find_program_address(
-            [
-                b"vesting",
-                bytes(token_config),
-                bytes(beneficiary),
-                start_time.to_bytes(8, "little"),
-            ],
+        return _find_program_address(
             self.program_addresses.token,
+            b"vesting",
+            bytes(token_config),
+            bytes(beneficiary),
+            start_time.to_bytes(8, "little"),
         )
 
     def derive_multisig_pda(self, token_mint: Pubkey) -> tuple[Pubkey, int]:
         """Derive multi-sig PDA"""
-        return Pubkey.find_program_address(
-            [b"multisig", bytes(token_mint)],
+        return _find_program_address(
             self.program_addresses.factory,
+            b"multisig",
+            bytes(token_mint),
         )
 
     def derive_dividend_round_pda(self, token_config: Pubkey, round_id: int) -> tuple[Pubkey, int]:
         """Derive dividend round PDA"""
-        return Pubkey.find_program_address(
-            [b"dividend_round", bytes(token_config), round_id.to_bytes(8, "little")],
+        return _find_program_address(
             self.program_addresses.token,
+            b"dividend_round",
+            bytes(token_config),
+            round_id.to_bytes(8, "little"),
         )
 
     def derive_proposal_pda(self, token_config: Pubkey, proposal_id: int) -> tuple[Pubkey, int]:
         """Derive governance proposal PDA"""
-        return Pubkey.find_program_address(
-            [b"proposal", bytes(token_config), proposal_id.to_bytes(8, "little")],
+        return _find_program_address(
             self.program_addresses.governance,
+            b"proposal",
+            bytes(token_config),
+            proposal_id.to_bytes(8, "little"),
         )
 
 
@@ -1,11 +1,13 @@
 """Sync service to fetch on-chain data and store in database"""
 import base64
+import hashlib
 import struct
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 import structlog
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from solana.rpc.types import MemcmpOpts
 from solders.pubkey import Pubkey
 
 from app.models.token import Token
@@ -15,9 +17,40 @@ from app.config import get_settings
 logger = structlog.get_logger()
 settings = get_settings()
 
+_B58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+
+
+def _b58encode(data: bytes) -> str:
+    """Base58-encode bytes (Bitcoin alphabet), as RPC memcmp filters expect"""
+    value = int.from_bytes(data, "big")
+    encoded = ""
+    while value:
+        value, digit = divmod(value, 58)
+        encoded = _B58_ALPHABET[digit] + encoded
+    # Each leading zero byte is encoded as a leading "1"
+    return "1" * (len(data) - len(data.lstrip(b"\0"))) + encoded
+
+
 # TokenConfig account discriminator (first 8 bytes)
-# This is derived from the account name hash in Anchor
-TOKEN_CONFIG_DISCRIMINATOR = bytes([0x9f, 0x04, 0x7a, 0x00, 0x79, 0x03, 0x9c, 0x5e])
+# Anchor derives it as sha256("account:<AccountName>")[:8]
+TOKEN_CONFIG_DISCRIMINATOR = hashlib.sha256(b"account:TokenConfig").digest()[:8]
+TOKEN_CONFIG_DISCRIMINATOR_B58 = _b58encode(TOKEN_CONFIG_DISCRIMINATOR)
+
+# TokenConfig accounts are exactly 220 bytes
+TOKEN_CONFIG_SIZE = 220
+
+# Have the validator return only TokenConfig accounts
+TOKEN_CONFIG_FILTERS = [
+    TOKEN_CONFIG_SIZE,
+    MemcmpOpts(offset=0, bytes=TOKEN_CONFIG_DISCRIMINATOR_B58),
+]
+
+# Precompiled layouts for parse_token_config
+_U32 = struct.Struct('<I')
+# discriminator + factory (skipped), token_id, authority, mint
+_TOKEN_CONFIG_PREFIX = struct.Struct('<40xQ32s32s')
+# decimals, total_supply, split_multiplier (skipped), features, paused
+_TOKEN_CONFIG_TAIL = struct.Struct('<BQ8x6?')
 
 
 def parse_token_config(data: bytes) -> Optional[Dict[str, Any]]:
@@ -38,57 +71,36 @@ def parse_token_config(data: bytes) -> Optional[Dict[str, Any]]:
     - paused: bool
     """
     try:
-        # Skip 8-byte discriminator
-        offset = 8
-
-        # factory: Pubkey (32 bytes) - skip
-        offset += 32
-
-        # token_id: u64 (8 bytes)
-        token_id = struct.unpack_from('<Q', data, offset)[0]
-        offset += 8
-
-        # authority: Pubkey (32 bytes)
-        authority = Pubkey.from_bytes(data[offset:offset+32])
-        offset += 32
-
-        # mint: Pubkey (32 bytes)
-        mint = Pubkey.from_bytes(data[offset:offset+32])
-        offset += 32
-
-        # symbol: String (4 bytes length + data)
-        symbol_len = struct.unpack_from('<I', data, offset)[0]
-        offset += 4
-        symbol = data[offset:offset+symbol_len].decode('utf-8').rstrip('\x00')
-        offset += symbol_len
-
-        # name: String (4 bytes length + data)
-        name_len = struct.unpack_from('<I', data, offset)[0]
-        offset += 4
-        name = data[offset:offset+name_len].decode('utf-8').rstrip('\x00')
-        offset += name_len
-
-        # decimals: u8 (1 byte)
-        decimals = data[offset]
-        offset += 1
-
-        # total_supply: u64 (8 bytes)
-        total_supply = struct.unpack_from('<Q', data, offset)[0]
-        offset += 8
-
-        # split_multiplier: u64 (8 bytes) - skip
-        offset += 8
-
-        # features: TokenFeatures struct (5 bools = 5 bytes)
-        vesting_enabled = bool(data[offset])
-        governance_enabled = bool(data[offset + 1])
-        dividends_enabled = bool(data[offset + 2])
-        transfer_restrictions_enabled = bool(data[offset + 3])
-        upgradeable = bool(data[offset + 4])
-        offset += 5
-
-        # paused: bool (1 byte)
-        paused = bool(data[offset])
+        # Zero-copy view; struct and str() read it through the buffer protocol
+        view = memoryview(data)
+
+        # Fixed prefix: discriminator and factory skipped, then token_id,
+        # authority and mint
+        token_id, authority_bytes, mint_bytes = _TOKEN_CONFIG_PREFIX.unpack_from(view, 0)
+
+        # symbol and name: the only variable-length fields (u32 length + data)
+        symbol_start = _TOKEN_CONFIG_PREFIX.size + 4
+        symbol_end = symbol_start + _U32.unpack_from(view, _TOKEN_CONFIG_PREFIX.size)[0]
+        name_start = symbol_end + 4
+        name_end = name_start + _U32.unpack_from(view, symbol_end)[0]
+
+        # Fixed tail: decimals, total_supply, split_multiplier (skipped),
+        # five feature flags and paused
+        (
+            decimals,
+            total_supply,
+            vesting_enabled,
+            governance_enabled,
+            dividends_enabled,
+            transfer_restrictions_enabled,
+            upgradeable,
+            paused,
+        ) = _TOKEN_CONFIG_TAIL.unpack_from(view, name_end)
+
+        authority = Pubkey.from_bytes(authority_bytes)
+        mint = Pubkey.from_bytes(mint_bytes)
+        symbol = str(view[symbol_start:symbol_end], 'utf-8').rstrip('\x00')
+        name = str(view[name_start:name_end], 'utf-8').rstrip('\x00')
 
         return {
             'token_id': token_id,
@@ -131,12 +143,17 @@ async def sync_tokens_from_chain(db: AsyncSession) -> Dict[str, Any]:
 
         logger.info("Syncing tokens from chain", program_id=str(factory_program_id))
 
-        # Get all accounts from the factory program
-        # TokenConfig accounts are typically ~300-500 bytes
-        accounts = await client.get_program_accounts(factory_program_id)
+        # Get the factory program's TokenConfig accounts (filtered server-side
+        # by size and discriminator rather than scanning every account)
+        accounts = await client.get_program_accounts(
+            factory_program_id,
+            filters=TOKEN_CONFIG_FILTERS,
+        )
 
         logger.info(f"Found {len(accounts)} accounts from token program")
 
+        # Pass 1: decode and parse every account
+        parsed_list = []
         for account_info in accounts:
             try:
                 pubkey = account_info['pubkey']
@@ -152,23 +169,40 @@ async def sync_tokens_from_chain(db: AsyncSession) -> Dict[str, Any]:
                 else:
                     continue
 
-                # Check if this looks like a TokenConfig by size
-                # TokenConfig accounts are exactly 220 bytes
-                if len(raw_data) != 220:
-                    continue
-
                 # Try to parse as TokenConfig
                 parsed = parse_token_config(raw_data)
                 if parsed is None:
                     continue
 
-                stats['found_on_chain'] += 1
+                parsed['pubkey'] = pubkey
+                parsed_list.append(parsed)
+
+            except Exception as e:
+                stats['errors'] += 1
+                logger.warning("Error processing account", error=str(e))
+                continue
 
-                # Check if token already exists in DB by token_id
-                result = await db.execute(
-                    select(Token).where(Token.token_id == parsed['token_id'])
-                )
-                existing_token = result.scalar_one_or_none()
+        stats['found_on_chain'] = len(parsed_list)
+
+        # Pass 2: look up existing tokens (by token_id, and by symbol for the
+        # duplicate check) in one query each, then update or create
+        result = await db.execute(
+            select(Token).where(Token.token_id.in_([p['token_id'] for p in parsed_list]))
+        )
+        existing = {t.token_id: t for t in result.scalars().all()}
+
+        result = await db.execute(
+            select(Token).where(Token.symbol.in_([
+                p['symbol'] for p in parsed_list if p['token_id'] not in existing
+            ]))
+        )
+        by_symbol = {t.symbol: t for t in result.scalars().all()}
+        by_symbol.update((t.symbol, t) for t in existing.values())
+
+        new_tokens = []
+        for parsed in parsed_list:
+            try:
+                existing_token = existing.get(parsed['token_id'])
 
                 if existing_token:
                     # Update existing token
@@ -180,14 +214,12 @@ async def sync_tokens_from_chain(db: AsyncSession) -> Dict[str, Any]:
                     existing_token.features = parsed['features']
                     existing_token.is_paused = parsed['paused']
                     existing_token.updated_at = datetime.utcnow()
+                    by_symbol[existing_token.symbol] = existing_token
                     stats['updated'] += 1
                     logger.info(f"Updated token {parsed['symbol']}", token_id=parsed['token_id'])
                 else:
                     # Check for duplicate symbol before creating
-                    symbol_check = await db.execute(
-                        select(Token).where(Token.symbol == parsed['symbol'])
-                    )
-                    duplicate_symbol = symbol_check.scalar_one_or_none()
+                    duplicate_symbol = by_symbol.get(parsed['symbol'])
 
                     if duplicate_symbol:
                         # Skip - symbol already exists with different token_id
@@ -202,7 +234,7 @@ async def sync_tokens_from_chain(db: AsyncSession) -> Dict[str, Any]:
                     # Create new token
                     new_token = Token(
                         token_id=parsed['token_id'],
-                        on_chain_config=pubkey,
+                        on_chain_config=parsed['pubkey'],
                         mint_address=parsed['mint'],
                         symbol=parsed['symbol'],
                         name=parsed['name'],
@@ -211,7 +243,9 @@ async def sync_tokens_from_chain(db: AsyncSession) -> Dict[str, Any]:
                         features=parsed['features'],
                         is_paused=parsed['paused'],
                     )
-                    db.add(new_token)
+                    new_tokens.append(new_token)
+                    existing[new_token.token_id] = new_token
+                    by_symbol[new_token.symbol] = new_token
                     stats['created'] += 1
                     logger.info(f"Created token {parsed['symbol']}", token_id=parsed['token_id'])
 
@@ -220,6 +254,7 @@ async def sync_tokens_from_chain(db: AsyncSession) -> Dict[str, Any]:
                 logger.warning("Error processing account", error=str(e))
                 continue
 
+        db.add_all(new_tokens)
         await db.commit()
         logger.info("Token sync completed", **stats)
 
@@ -1,4 +1,5 @@
 """Transaction service for recording and reconstructing state from unified transactions."""
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Set, Tuple
@@ -200,11 +201,15 @@ class TransactionService:
         return state
 
     def _apply_transaction(self, state: TokenState, tx: UnifiedTransaction) -> None:
-        """Apply a single transaction to the state."""
+        """Apply a single transaction to the state.
+
+        Wallet addresses are interned so each holder is a single string object
+        across balances, positions and the responses built from them.
+        """
         match tx.tx_type:
             case TransactionType.APPROVAL:
                 if tx.wallet:
-                    state.approved_wallets.add(tx.wallet)
+                    state.approved_wallets.add(sys.intern(tx.wallet))
 
             case TransactionType.REVOCATION:
                 if tx.wallet:
@@ -212,11 +217,12 @@ class TransactionService:
 
             case TransactionType.MINT | TransactionType.SHARE_GRANT:
                 if tx.wallet and tx.amount:
+                    wallet = sys.intern(tx.wallet)
                     # Add to position
-                    key = (tx.wallet, tx.share_class_id)
+                    key = (wallet, tx.share_class_id)
                     if key not in state.positions:
                         state.positions[key] = PositionState(
-                            wallet=tx.wallet,
+                            wallet=wallet,
                             share_class_id=tx.share_class_id or 0,
                             shares=0,
                             cost_basis=0,
@@ -227,17 +233,19 @@ class TransactionService:
                     state.positions[key].cost_basis += tx.amount_secondary or 0
 
                     # Add to balance
-                    state.balances[tx.wallet] = state.balances.get(tx.wallet, 0) + tx.amount
+                    state.balances[wallet] = state.balances.get(wallet, 0) + tx.amount
                     state.total_supply += tx.amount
 
             case TransactionType.TRANSFER:
                 if tx.wallet and tx.wallet_to and tx.amount:
-                    state.balances[tx.wallet] = state.balances.get(tx.wallet, 0) - tx.amount
-                    state.balances[tx.wallet_to] = state.balances.get(tx.wallet_to, 0) + tx.amount
+                    wallet, wallet_to = sys.intern(tx.wallet), sys.intern(tx.wallet_to)
+                    state.balances[wallet] = state.balances.get(wallet, 0) - tx.amount
+                    state.balances[wallet_to] = state.balances.get(wallet_to, 0) + tx.amount
 
             case TransactionType.BURN:
                 if tx.wallet and tx.amount:
-                    state.balances[tx.wallet] = state.balances.get(tx.wallet, 0) - tx.amount
+                    wallet = sys.intern(tx.wallet)
+                    state.balances[wallet] = state.balances.get(wallet, 0) - tx.amount
                     state.total_supply -= tx.amount
 
             case TransactionType.VESTING_SCHEDULE_CREATE:
@@ -245,7 +253,7 @@ class TransactionService:
                     data = tx.data or {}
                     state.vesting_schedules[tx.reference_id] = VestingState(
                         schedule_id=tx.reference_id,
-                        beneficiary=tx.wallet,
+                        beneficiary=sys.intern(tx.wallet),
                         total_amount=tx.amount or 0,
                         released_amount=0,
                         share_class_id=tx.share_class_id,
@@ -259,11 +267,12 @@ class TransactionService:
 
             case TransactionType.VESTING_RELEASE:
                 if tx.wallet and tx.amount:
+                    wallet = sys.intern(tx.wallet)
                     # Add released shares to position and balance
-                    key = (tx.wallet, tx.share_class_id)
+                    key = (wallet, tx.share_class_id)
                     if key not in state.positions:
                         state.positions[key] = PositionState(
-                            wallet=tx.wallet,
+                            wallet=wallet,
                             share_class_id=tx.share_class_id or 0,
                             shares=0,
                             cost_basis=0,
@@ -271,7 +280,7 @@ class TransactionService:
                             preference_multiple=tx.preference_multiple or 1.0,
                         )
                     state.positions[key].shares += tx.amount
-                    state.balances[tx.wallet] = state.balances.get(tx.wallet, 0) + tx.amount
+                    state.balances[wallet] = state.balances.get(wallet, 0) + tx.amount
                     state.total_supply += tx.amount
 
                     # Update schedule's released amount
@@ -309,11 +318,12 @@ class TransactionService:
             case TransactionType.CONVERTIBLE_CONVERT:
                 # SAFE/Note conversion - adds shares to holder
                 if tx.wallet and tx.amount:
+                    wallet = sys.intern(tx.wallet)
                     # Add to position
-                    key = (tx.wallet, tx.share_class_id)
+                    key = (wallet, tx.share_class_id)
                     if key not in state.positions:
                         state.positions[key] = PositionState(
-                            wallet=tx.wallet,
+                            wallet=wallet,
                             share_class_id=tx.share_class_id or 0,
                             shares=0,
                             cost_basis=0,
@@ -324,17 +334,18 @@ class TransactionService:
                     state.positions[key].cost_basis += tx.amount_secondary or 0
 
                     # Add to balance
-                    state.balances[tx.wallet] = state.balances.get(tx.wallet, 0) + tx.amount
+                    state.balances[wallet] = state.balances.get(wallet, 0) + tx.amount
                     state.total_supply += tx.amount
 
             case TransactionType.INVESTMENT:
                 # Investment in funding round - adds shares to investor
                 if tx.wallet and tx.amount:
+                    wallet = sys.intern(tx.wallet)
                     # Add to position
-                    key = (tx.wallet, tx.share_class_id)
+                    key = (wallet, tx.share_class_id)
                     if key not in state.positions:
                         state.positions[key] = PositionState(
-                            wallet=tx.wallet,
+                            wallet=wallet,
                             share_class_id=tx.share_class_id or 0,
                             shares=0,
                             cost_basis=0,
@@ -345,7 +356,7 @@ class TransactionService:
                     state.positions[key].cost_basis += tx.amount_secondary or 0
 
                     # Add to balance
-                    state.balances[tx.wallet] = state.balances.get(tx.wallet, 0) + tx.amount
+                    state.balances[wallet] = state.balances.get(wallet, 0) + tx.amount
                     state.total_supply += tx.amount
 
             # Other transaction types don't directly affect reconstructed state
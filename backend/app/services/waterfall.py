@@ -9,9 +9,10 @@ Supports non-participating preferred:
 2. Distribute remaining proceeds pro-rata by share count to ALL shareholders
 3. Preferred shareholders take the GREATER of their preference OR their pro-rata share
 """
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Sequence, Tuple
 from dataclasses import dataclass, field
 from collections import defaultdict
+from operator import attrgetter
 
 
 @dataclass
@@ -105,6 +106,58 @@ class WaterfallResult:
         }
 
 
+@dataclass
+class _PositionColumns:
+    """Per-position values that do not depend on the exit amount.
+
+    Computed once and reused across scenarios so the distribution loops work on
+    plain lists instead of recomputing preference amounts per access.
+    """
+    positions: List[WaterfallPosition]
+    preferences: List[int]  # preference_amount, parallel to positions
+    tiers: List[Tuple[int, List[int], int]]  # (priority, position indices, total preference)
+    total_shares: int
+    total_preference: int
+
+
+def _build_columns(positions: List[WaterfallPosition]) -> _PositionColumns:
+    """Precompute preference amounts and priority tiers for a set of positions"""
+    preferences = [p.preference_amount for p in positions]
+
+    # Group by priority for display
+    tier_indices: Dict[int, List[int]] = defaultdict(list)
+    for i, pos in enumerate(positions):
+        tier_indices[pos.priority].append(i)
+
+    tiers = []
+    for priority in sorted(tier_indices):
+        indices = tier_indices[priority]
+        tiers.append((priority, indices, sum(preferences[i] for i in indices)))
+
+    return _PositionColumns(
+        positions=positions,
+        preferences=preferences,
+        tiers=tiers,
+        total_shares=sum(map(attrgetter("shares"), positions)),
+        total_preference=sum(preferences),
+    )
+
+
+def _payout(pos: WaterfallPosition, preference_amount: int, payout: int, source: str) -> WaterfallPayout:
+    """Materialize a payout row for a position"""
+    return WaterfallPayout(
+        wallet=pos.wallet,
+        share_class_name=pos.share_class_name,
+        priority=pos.priority,
+        shares=pos.shares,
+        cost_basis=pos.cost_basis,
+        preference_amount=preference_amount,
+        preference_multiple=pos.preference_multiple,
+        payout=payout,
+        payout_source=source,
+    )
+
+
 def calculate_waterfall(
     positions: List[WaterfallPosition],
     exit_amount: int,
@@ -132,88 +185,54 @@ def calculate_waterfall(
             remaining_amount=exit_amount,
         )
 
-    total_shares = sum(p.shares for p in positions)
+    return _calculate_from_columns(_build_columns(positions), exit_amount)
 
-    # Group by priority for display
-    tiers_map: Dict[int, List[WaterfallPosition]] = defaultdict(list)
-    for pos in positions:
-        tiers_map[pos.priority].append(pos)
-    sorted_priorities = sorted(tiers_map.keys())
+
+def _calculate_from_columns(cols: _PositionColumns, exit_amount: int) -> WaterfallResult:
+    """Run the waterfall for one exit amount over precomputed position columns"""
+    positions = cols.positions
+    preferences = cols.preferences
+    total_shares = cols.total_shares
 
     # Track final payouts and decisions
     final_payouts: Dict[str, tuple] = {}  # wallet -> (payout, source)
 
-    # First, calculate total preferences
-    total_all_preferences = sum(p.preference_amount for p in positions)
-
     # If total preferences >= exit amount, do strict waterfall by priority
-    if total_all_preferences >= exit_amount:
+    if cols.total_preference >= exit_amount:
         remaining = exit_amount
         result_tiers: List[WaterfallTier] = []
 
-        for priority in sorted_priorities:
-            tier_positions = tiers_map[priority]
-            total_preference = sum(p.preference_amount for p in tier_positions)
+        for priority, indices, total_preference in cols.tiers:
             amount_available = remaining
-            tier_payouts: List[WaterfallPayout] = []
 
             if remaining <= 0:
-                for pos in tier_positions:
-                    tier_payouts.append(WaterfallPayout(
-                        wallet=pos.wallet,
-                        share_class_name=pos.share_class_name,
-                        priority=pos.priority,
-                        shares=pos.shares,
-                        cost_basis=pos.cost_basis,
-                        preference_amount=pos.preference_amount,
-                        preference_multiple=pos.preference_multiple,
-                        payout=0,
-                        payout_source="none",
-                    ))
                 result_tiers.append(WaterfallTier(
                     priority=priority,
                     total_preference=total_preference,
                     amount_available=0,
                     amount_distributed=0,
                     fully_satisfied=False,
-                    payouts=tier_payouts,
+                    payouts=[_payout(positions[i], preferences[i], 0, "none") for i in indices],
                 ))
                 continue
 
             if remaining >= total_preference:
-                for pos in tier_positions:
-                    tier_payouts.append(WaterfallPayout(
-                        wallet=pos.wallet,
-                        share_class_name=pos.share_class_name,
-                        priority=pos.priority,
-                        shares=pos.shares,
-                        cost_basis=pos.cost_basis,
-                        preference_amount=pos.preference_amount,
-                        preference_multiple=pos.preference_multiple,
-                        payout=pos.preference_amount,
-                        payout_source="preference",
-                    ))
+                tier_payouts = [
+                    _payout(positions[i], preferences[i], preferences[i], "preference")
+                    for i in indices
+                ]
                 amount_distributed = total_preference
                 remaining -= total_preference
                 fully_satisfied = True
             else:
-                for pos in tier_positions:
+                tier_payouts = []
+                for i in indices:
                     if total_preference > 0:
-                        share_of_remaining = pos.preference_amount / total_preference
+                        share_of_remaining = preferences[i] / total_preference
                         payout = int(remaining * share_of_remaining)
                     else:
                         payout = 0
-                    tier_payouts.append(WaterfallPayout(
-                        wallet=pos.wallet,
-                        share_class_name=pos.share_class_name,
-                        priority=pos.priority,
-                        shares=pos.shares,
-                        cost_basis=pos.cost_basis,
-                        preference_amount=pos.preference_amount,
-                        preference_multiple=pos.preference_multiple,
-                        payout=payout,
-                        payout_source="partial_preference",
-                    ))
+                    tier_payouts.append(_payout(positions[i], preferences[i], payout, "partial_preference"))
                 amount_distributed = remaining
                 remaining = 0
                 fully_satisfied = False
@@ -245,18 +264,11 @@ def calculate_waterfall(
     # 2. Distribute remaining pro-rata to common (those with no preference)
     # 3. Check if any preferred holder would do better by converting
 
-    remaining_after_preferences = exit_amount - total_all_preferences
-
-    # Shares held by common (no preference)
-    common_shares = sum(p.shares for p in positions if p.preference_amount == 0)
-    preferred_shares = sum(p.shares for p in positions if p.preference_amount > 0)
-
     # For each preferred holder, calculate what they'd get by converting
     # If they convert, they give up preference and share remaining with common pro-rata
-    for pos in positions:
-        if pos.preference_amount > 0:
-            # Option A: Take preference
-            pref_payout = pos.preference_amount
+    for pos, pref_payout in zip(positions, preferences):
+        if pref_payout > 0:
+            # Option A: Take preference (pref_payout)
 
             # Option B: Convert - get share of (exit_amount) based on shares
             # But only if ALL preferred convert (simplified model)
@@ -276,17 +288,14 @@ def calculate_waterfall(
             # Common holder - will get pro-rata of what's left after preferences
             final_payouts[pos.wallet] = (0, "common")  # Placeholder, calculated below
 
-    # Calculate amount taken by preferences
-    pref_amount_taken = sum(
-        payout for wallet, (payout, source) in final_payouts.items()
-        if source == "preference"
-    )
-
-    # Calculate amount taken by conversions
-    conversion_amount = sum(
-        payout for wallet, (payout, source) in final_payouts.items()
-        if source == "conversion"
-    )
+    # Calculate amount taken by preferences and conversions
+    pref_amount_taken = 0
+    conversion_amount = 0
+    for payout, source in final_payouts.values():
+        if source == "preference":
+            pref_amount_taken += payout
+        elif source == "conversion":
+            conversion_amount += payout
 
     # Remaining for common shareholders
     remaining_for_common = exit_amount - pref_amount_taken - conversion_amount
@@ -306,29 +315,18 @@ def calculate_waterfall(
                 payout = 0
             final_payouts[pos.wallet] = (payout, "common")
 
-    # Build result tiers
+    # Build result tiers - payout rows are only materialized here
     result_tiers: List[WaterfallTier] = []
     total_distributed = 0
 
-    for priority in sorted_priorities:
-        tier_positions = tiers_map[priority]
-        total_preference = sum(p.preference_amount for p in tier_positions)
+    for priority, indices, total_preference in cols.tiers:
         tier_payouts: List[WaterfallPayout] = []
         tier_distributed = 0
 
-        for pos in tier_positions:
+        for i in indices:
+            pos = positions[i]
             payout, source = final_payouts[pos.wallet]
-            tier_payouts.append(WaterfallPayout(
-                wallet=pos.wallet,
-                share_class_name=pos.share_class_name,
-                priority=pos.priority,
-                shares=pos.shares,
-                cost_basis=pos.cost_basis,
-                preference_amount=pos.preference_amount,
-                preference_multiple=pos.preference_multiple,
-                payout=payout,
-                payout_source=source,
-            ))
+            tier_payouts.append(_payout(pos, preferences[i], payout, source))
             tier_distributed += payout
 
         total_distributed += tier_distributed
@@ -352,7 +350,7 @@ def calculate_waterfall(
 
 def calculate_waterfall_scenarios(
     positions: List[WaterfallPosition],
-    exit_amounts: List[int],
+    exit_amounts: Sequence[int],
 ) -> List[WaterfallResult]:
     """
     Calculate waterfall for multiple exit scenarios.
@@ -366,4 +364,9 @@ def calculate_waterfall_scenarios(
     Returns:
         List of WaterfallResult, one per exit amount
     """
-    return [calculate_waterfall(positions, amount) for amount in exit_amounts]
+    if not positions:
+        return [calculate_waterfall(positions, amount) for amount in exit_amounts]
+
+    # Position columns don't depend on the exit amount - build them once
+    cols = _build_columns(positions)
+    return [_calculate_from_columns(cols, amount) for amount in exit_amounts]
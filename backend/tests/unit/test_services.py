@@ -1,10 +1,32 @@
 """Unit tests for ChainEquity backend services"""
+import asyncio
+import base64
+import hashlib
+import json
+import struct
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime
-
+from solders.pubkey import Pubkey
+from sqlalchemy import create_mock_engine
+from sqlalchemy.dialects import postgresql
+
+from app.models.database import Base, json_serializer
+from app.models.history import CapTableSnapshotV2, ChangeType, StateChange
+from app.models.vesting import VestingInterval, VestingIntervalType, VestingSchedule
+from app.services import history as history_module
+from app.services.history import COPY_THRESHOLD, HistoryService
+from app.services.indexer import TransactionIndexer
 from app.services.solana_client import SolanaClient, ProgramAddresses
 from app.services.event_processor import EventProcessor
+from app.services.sync import (
+    TOKEN_CONFIG_DISCRIMINATOR,
+    TOKEN_CONFIG_DISCRIMINATOR_B58,
+    TOKEN_CONFIG_SIZE,
+    parse_token_config,
+)
+from app.services.waterfall import WaterfallPosition, calculate_waterfall, calculate_waterfall_scenarios
 
 
 class TestSolanaClient:
@@ -29,9 +51,31 @@ class TestSolanaClient:
         assert isinstance(bump, int)
         assert 0 <= bump <= 255
 
+    @pytest.mark.asyncio
+    async def test_account_loader_coalesces_loads(self, client):
+        """Test that loads in the same tick share one getMultipleAccounts request"""
+        first, second = Pubkey.new_unique(), Pubkey.new_unique()
+        rpc = MagicMock()
+        rpc.get_multiple_accounts = AsyncMock(return_value=MagicMock(value=[
+            MagicMock(lamports=1, owner=first, data=b"", executable=False, rent_epoch=0),
+            None,
+        ]))
+        client._client = rpc
+
+        results = await asyncio.gather(
+            client.account_loader.load(first),
+            client.account_loader.load(second),
+            client.account_loader.load(first),
+        )
+
+        rpc.get_multiple_accounts.assert_awaited_once()
+        assert rpc.get_multiple_accounts.call_args.args[0] == [first, second]
+        assert results[0]["lamports"] == 1
+        assert results[1] is None
+        assert results[2] == results[0]
+
     def test_derive_multisig_pda(self, client):
         """Test multi-sig PDA derivation"""
-        from solders.pubkey import Pubkey
         mock_mint = Pubkey.new_unique()
         pda, bump = client.derive_multisig_pda(mock_mint)
         assert pda is not None
@@ -39,7 +83,6 @@ class TestSolanaClient:
 
     def test_derive_allowlist_pda(self, client):
         """Test allowlist PDA derivation"""
-        from solders.pubkey import Pubkey
         mock_token_config = Pubkey.new_unique()
         mock_wallet = Pubkey.new_unique()
         pda, bump = client.derive_allowlist_pda(mock_token_config, mock_wallet)
@@ -48,7 +91,6 @@ class TestSolanaClient:
 
     def test_derive_vesting_pda(self, client):
         """Test vesting PDA derivation"""
-        from solders.pubkey import Pubkey
         mock_token_config = Pubkey.new_unique()
         mock_beneficiary = Pubkey.new_unique()
         start_time = 1704067200
@@ -114,6 +156,78 @@ class TestEventProcessor:
         assert len(logs) == 3
         assert "Program data:" in logs[1]
 
+    @pytest.mark.asyncio
+    async def test_process_transaction_dispatches_program_data(self, processor):
+        """Test that only "Program data:" logs are decoded and routed"""
+        discriminator = processor.EVENT_DISCRIMINATORS["vote_cast"]
+        payload = discriminator + b"\x01" * 73
+        tx = MagicMock(signature="5" * 64)
+        tx_data = {
+            "meta": {
+                "logMessages": [
+                    "Program log: Instruction: CastVote",
+                    "Program data: " + base64.b64encode(payload).decode(),
+                ]
+            }
+        }
+        handler = AsyncMock()
+        with patch.dict(processor.EVENT_ROUTES, {discriminator: ("vote_cast", handler)}):
+            events = await processor.process_transaction(AsyncMock(), tx, tx_data)
+        assert events == ["vote_cast"]
+        assert handler.await_args.args[2:4] == (b"\x01" * 73, tx)
+
+    @pytest.mark.asyncio
+    async def test_process_transaction_drops_truncated_payload(self, processor):
+        """Test that a payload shorter than its layout never reaches the handler"""
+        discriminator = processor.EVENT_DISCRIMINATORS["vote_cast"]
+        tx = MagicMock(signature="5" * 64)
+        tx_data = {"meta": {"logMessages": [
+            "Program data: " + base64.b64encode(discriminator + b"\x01" * 8).decode(),
+        ]}}
+        handler = AsyncMock()
+        with patch.dict(processor.EVENT_ROUTES, {discriminator: ("vote_cast", handler)}):
+            events = await processor.process_transaction(AsyncMock(), tx, tx_data)
+        assert events == []
+        handler.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_process_transaction_skips_unknown_program_data(self, processor):
+        """Test that other programs' events are not decoded"""
+        tx = MagicMock(signature="5" * 64)
+        tx_data = {"meta": {"logMessages": [
+            "Program data: " + base64.b64encode(b"\xff" * 8 + b"\x00" * 8).decode(),
+        ]}}
+        with patch("app.services.event_processor.base64.b64decode") as b64decode:
+            events = await processor.process_transaction(AsyncMock(), tx, tx_data)
+        assert events == []
+        b64decode.assert_not_called()
+
+    def test_event_routes_cover_discriminators(self, processor):
+        """Test that every discriminator routes to its event type and handler"""
+        for event_type, disc in processor.EVENT_DISCRIMINATORS.items():
+            assert processor.EVENT_ROUTES[disc] == (
+                event_type, processor.EVENT_HANDLERS.get(event_type)
+            )
+
+    @pytest.mark.asyncio
+    async def test_process_transaction_sums_supply_updates(self, processor):
+        """Test that repeated mints of one token are written as a single update"""
+        mint, recipient = bytes([1]) * 32, bytes([2]) * 32
+        tx_data = {"meta": {"logMessages": [
+            "Program data: " + base64.b64encode(
+                processor.EVENT_DISCRIMINATORS["tokens_minted"] + mint + recipient + struct.pack("<Q", amount)
+            ).decode()
+            for amount in (100, 50)
+        ]}}
+        session = MagicMock(execute=AsyncMock())
+        tx = MagicMock(signature="5" * 64, block_time=None)
+
+        events = await processor.process_transaction(session, tx, tx_data)
+
+        assert events == ["tokens_minted", "tokens_minted"]
+        session.execute.assert_awaited_once()
+        assert session.execute.await_args.args[1]["amount"] == 150
+
 
 class TestVestingCalculations:
     """Tests for vesting calculation logic"""
@@ -142,6 +256,110 @@ class TestVestingCalculations:
         pass
 
 
+class TestVestingScheduleIntervals:
+    """Tests for VestingSchedule interval math"""
+
+    @pytest.fixture
+    def schedule(self):
+        """Create a 10-minute schedule of 1003 shares with no cliff"""
+        return VestingSchedule(
+            beneficiary="Lp5Q3vTs123456789012345678901234567890123456",
+            total_amount=1003,
+            released_amount=0,
+            start_time=datetime(2024, 1, 1),
+            cliff_seconds=0,
+            duration_seconds=600,
+            interval="minute",
+            intervals_released=0,
+        )
+
+    def test_interval_params(self, schedule):
+        """Test interval count, amount per interval and remainder"""
+        assert schedule.interval_seconds == 60
+        assert schedule.total_intervals() == 10
+        assert schedule.amount_per_interval() == 100
+        assert schedule.remainder() == 3
+
+    def test_invalid_interval_defaults_to_minute(self, schedule):
+        """Test that an unknown interval falls back to 60 seconds"""
+        schedule.interval = "fortnight"
+        assert schedule.interval_seconds == 60
+
+    def test_interval_column_stores_codes(self):
+        """Test interval bind values, with unknown intervals stored as minute"""
+        column_type = VestingIntervalType()
+        assert column_type.process_bind_param(VestingInterval.DAY, None) == 2
+        assert column_type.process_bind_param("month", None) == 3
+        assert column_type.process_bind_param("fortnight", None) == 0
+        assert column_type.process_result_value(1, None) == "hour"
+
+    def test_interval_params_follow_updates(self, schedule):
+        """Test that memoized values are recomputed after in-place changes"""
+        assert schedule.amount_per_interval() == 100
+        schedule.total_amount = 2006  # e.g. 2:1 stock split
+        assert schedule.amount_per_interval() == 200
+        assert schedule.remainder() == 6
+
+    def test_calculate_vested(self, schedule):
+        """Test vested amounts including remainder on the final intervals"""
+        start = schedule.start_time
+        assert schedule.calculate_vested(start) == 0
+        assert schedule.calculate_vested(start.replace(minute=5)) == 500
+        assert schedule.calculate_vested(start.replace(minute=8)) == 801
+        assert schedule.calculate_vested(start.replace(minute=10)) == 1003
+
+    def test_calculate_releasable_intervals(self, schedule):
+        """Test releasable interval count after partial release"""
+        schedule.intervals_released = 2
+        assert schedule.calculate_releasable_intervals(schedule.start_time.replace(minute=5)) == 3
+        assert schedule.calculate_releasable_intervals(schedule.start_time.replace(hour=1)) == 8
+
+
+class TestWaterfallCalculations:
+    """Tests for liquidation waterfall distribution"""
+
+    @pytest.fixture
+    def positions(self):
+        """Series A (2x on $1M) ahead of common"""
+        return [
+            WaterfallPosition(
+                wallet="investor", share_class_name="Series A", priority=1,
+                shares=1_000_000, cost_basis=100_000_000, preference_multiple=2.0,
+            ),
+            WaterfallPosition(
+                wallet="founder", share_class_name="Common", priority=99,
+                shares=9_000_000, cost_basis=0, preference_multiple=1.0,
+            ),
+        ]
+
+    def test_partial_preference_below_total_preferences(self, positions):
+        """Test exit below total preference pays only the senior tier"""
+        result = calculate_waterfall(positions, 150_000_000)
+        assert result.get_payout_by_wallet() == {"investor": 150_000_000, "founder": 0}
+        assert result.tiers[0].payouts[0].payout_source == "partial_preference"
+        assert result.tiers[1].payouts[0].payout_source == "none"
+        assert result.remaining_amount == 0
+
+    def test_common_gets_remainder_after_preference(self, positions):
+        """Test common holders share what is left after preferences"""
+        result = calculate_waterfall(positions, 500_000_000)
+        assert result.get_payout_by_wallet() == {"investor": 200_000_000, "founder": 300_000_000}
+
+    def test_preferred_converts_when_pro_rata_is_higher(self, positions):
+        """Test preferred holder converts on a large exit"""
+        result = calculate_waterfall(positions, 10_000_000_000)
+        assert result.tiers[0].payouts[0].payout_source == "conversion"
+        assert result.get_payout_by_wallet()["investor"] == 1_000_000_000
+
+    def test_scenarios_match_single_calculations(self, positions):
+        """Test that scenarios reuse positions without changing results"""
+        exits = [0, 150_000_000, 500_000_000, 10_000_000_000]
+        results = calculate_waterfall_scenarios(positions, exits)
+        assert [r.to_dict() for r in results] == [
+            calculate_waterfall(positions, amount).to_dict() for amount in exits
+        ]
+
+
 class TestDividendCalculations:
     """Tests for dividend calculation logic"""
 
@@ -186,3 +404,348 @@ class TestMultiSigLogic:
         approvers = ["signer1", "signer2"]
         threshold = 2
         assert len(approvers) >= threshold
+
+
+class TestHistoryService:
+    """Tests for state change recording"""
+
+    @pytest.mark.asyncio
+    async def test_queued_changes_flush_in_one_insert(self):
+        """Test that changes recorded with flush=False are written together"""
+        session = MagicMock(execute=AsyncMock(), flush=AsyncMock())
+        history = HistoryService(session)
+
+        for entity_id in ("1", "2", "3"):
+            change = await history.record_change(
+                "wallets", entity_id, ChangeType.UPDATE, new_state={"id": entity_id}, slot=10, flush=False,
+            )
+            assert change is None
+
+        session.add.assert_not_called()
+        session.execute.assert_not_awaited()
+
+        assert await history.flush_pending() == 3
+        session.execute.assert_awaited_once()
+        rows = session.execute.await_args.args[1]
+        assert [row["entity_id"] for row in rows] == ["1", "2", "3"]
+        assert await history.flush_pending() == 0
+        session.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_current_slot_shared_across_instances(self):
+        """Test that the slot RPC is reused by services created within one slot"""
+        client = MagicMock(get_slot=AsyncMock(return_value=42), get_block_time=AsyncMock(return_value=1700000000))
+        with patch.object(history_module, "_slot_cache", history_module._SlotCache(ttl=60)), \
+                patch.object(history_module, "get_solana_client", AsyncMock(return_value=client)):
+            slots = [await HistoryService(MagicMock()).get_current_slot() for _ in range(3)]
+
+        assert slots == [42, 42, 42]
+        client.get_slot.assert_awaited_once()
+        client.get_block_time.assert_awaited_once_with(42)
+
+    @pytest.mark.asyncio
+    async def test_update_records_only_changed_old_values(self):
+        """Test that UPDATEs keep old values of changed columns and skip no-ops"""
+        session = MagicMock(execute=AsyncMock(), flush=AsyncMock())
+        history = HistoryService(session)
+        old = {"id": 1, "status": "pending", "address": "abc"}
+
+        change = await history.record_change(
+            "wallets", "1", ChangeType.UPDATE, old_state=old, new_state={**old, "status": "active"}, slot=10,
+        )
+        assert change.old_state == {"status": "pending"}
+        assert change.new_state == {"id": 1, "status": "active", "address": "abc"}
+
+        assert await history.record_change(
+            "wallets", "1", ChangeType.UPDATE, old_state=old, new_state=dict(old), slot=11,
+        ) is None
+        session.add.assert_called_once()
+
+    def test_history_tables_created_with_lz4(self):
+        """Test that creating the history tables on PostgreSQL sets lz4 compression"""
+        statements = []
+        engine = create_mock_engine(
+            "postgresql://",
+            lambda sql, *args, **kwargs: statements.append(str(sql.compile(dialect=engine.dialect))),
+        )
+        Base.metadata.create_all(
+            engine, tables=[StateChange.__table__, CapTableSnapshotV2.__table__], checkfirst=False,
+        )
+
+        compression = [s for s in statements if "SET COMPRESSION lz4" in s]
+        assert len(compression) == 2
+        assert "ALTER TABLE state_changes ALTER COLUMN old_state SET COMPRESSION lz4" in compression[0]
+        assert "ALTER TABLE captable_snapshots_v2" in compression[1]
+
+    @pytest.mark.asyncio
+    async def test_large_flush_copies_records(self):
+        """Test that a flush of COPY_THRESHOLD changes is bulk-loaded with COPY"""
+        raw_connection = MagicMock()
+        raw_connection.driver_connection.copy_records_to_table = AsyncMock()
+        connection = MagicMock(get_raw_connection=AsyncMock(return_value=raw_connection))
+        session = MagicMock(execute=AsyncMock(), connection=AsyncMock(return_value=connection))
+        history = HistoryService(session)
+
+        for entity_id in range(COPY_THRESHOLD):
+            await history.record_change(
+                "wallets", str(entity_id), ChangeType.CREATE, new_state={"id": entity_id},
+                slot=10, token_id=1, triggered_by="test", flush=False,
+            )
+        assert await history.flush_pending() == COPY_THRESHOLD
+
+        session.execute.assert_not_awaited()
+        copy = raw_connection.driver_connection.copy_records_to_table
+        copy.assert_awaited_once()
+        assert copy.call_args.args[0] == StateChange.__tablename__
+        columns = copy.call_args.kwargs["columns"]
+        assert set(columns) <= set(StateChange.__table__.columns.keys())
+        records = copy.call_args.kwargs["records"]
+        assert len(records) == COPY_THRESHOLD
+
+        record = dict(zip(columns, records[0]))
+        assert record["slot"] == 10
+        assert record["entity_id"] == "0"
+        assert record["token_id"] == 1
+        # Enum columns store member names, JSONB is sent as text
+        assert record["change_type"] in StateChange.__table__.c.change_type.type.enums
+        assert record["change_type"] == ChangeType.CREATE.name
+        assert record["old_state"] is None
+        assert json.loads(record["new_state"]) == {"id": 0}
+        assert record["triggered_by"] == "test"
+
+
+class TestTokenSync:
+    """Tests for on-chain token sync"""
+
+    def test_discriminator_base58_matches_bytes(self):
+        """Test that the memcmp filter encodes Anchor's TokenConfig discriminator"""
+        assert TOKEN_CONFIG_DISCRIMINATOR == hashlib.sha256(b"account:TokenConfig").digest()[:8]
+        assert TOKEN_CONFIG_DISCRIMINATOR.hex() == "5c49ff2b6b337565"
+
+        alphabet = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+        value = 0
+        for char in TOKEN_CONFIG_DISCRIMINATOR_B58:
+            value = value * 58 + alphabet.index(char)
+        assert value.to_bytes(8, "big") == TOKEN_CONFIG_DISCRIMINATOR
+
+    def test_parse_token_config(self):
+        """Test TokenConfig parsing from a serialized account"""
+        authority, mint = Pubkey.new_unique(), Pubkey.new_unique()
+        data = b"".join([
+            TOKEN_CONFIG_DISCRIMINATOR,
+            bytes(Pubkey.new_unique()),
+            struct.pack("<Q", 7),
+            bytes(authority),
+            bytes(mint),
+            struct.pack("<I", 4), b"ACME",
+            struct.pack("<I", 9), b"Acme Corp",
+            bytes([6]),
+            struct.pack("<QQ", 1_000_000, 1),
+            bytes([1, 0, 1, 0, 1]),
+            bytes([1]),
+        ])
+        data += bytes(TOKEN_CONFIG_SIZE - len(data))
+
+        assert parse_token_config(data) == {
+            "token_id": 7,
+            "mint": str(mint),
+            "authority": str(authority),
+            "symbol": "ACME",
+            "name": "Acme Corp",
+            "decimals": 6,
+            "total_supply": 1_000_000,
+            "features": {
+                "vesting_enabled": True,
+                "governance_enabled": False,
+                "dividends_enabled": True,
+                "transfer_restrictions_enabled": False,
+                "upgradeable": True,
+            },
+            "paused": True,
+        }
+        assert parse_token_config(data[:44]) is None
+
+
+class TestTransactionIndexer:
+    """Tests for the transaction indexer"""
+
+    @pytest.fixture
+    def indexer(self):
+        """Create an indexer with a mocked client and event processor"""
+        indexer = TransactionIndexer(solana_client=SolanaClient(rpc_url="https://api.devnet.solana.com"))
+        indexer.event_processor = MagicMock(process_transaction=AsyncMock())
+        return indexer
+
+    @staticmethod
+    def _session(inserted_signature):
+        """Mock session whose INSERT ... RETURNING yields inserted_signature"""
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = inserted_signature
+        return MagicMock(execute=AsyncMock(return_value=result), commit=AsyncMock())
+
+    @pytest.mark.asyncio
+    async def test_process_transaction_inserts_and_applies_events(self, indexer):
+        """Test that a new transaction is inserted into the model's columns and its events applied"""
+        session = self._session("sig1")
+        sig_info = {"signature": "sig1", "slot": 42, "block_time": 1700000000}
+
+        await indexer._process_transaction(session, "token", sig_info, {"meta": {}})
+
+        statement = session.execute.call_args.args[0].compile(dialect=postgresql.dialect())
+        assert "ON CONFLICT (signature) DO NOTHING" in str(statement)
+        assert statement.params["program_id"] == str(indexer._client.program_addresses.token)
+        assert statement.params["status"] == "success"
+        assert statement.params["slot"] == 42
+
+        indexer.event_processor.process_transaction.assert_awaited_once()
+        tx = indexer.event_processor.process_transaction.call_args.args[1]
+        assert tx.signature == "sig1"
+        assert tx.program_id == str(indexer._client.program_addresses.token)
+
+    @pytest.mark.asyncio
+    async def test_poll_once_stops_cursor_at_first_failure(self, indexer):
+        """Test that a failed transaction holds the cursor back so it is retried"""
+        signatures = [  # newest first, as the RPC returns them
+            {"signature": "s3", "slot": 3, "err": None},
+            {"signature": "s2", "slot": 2, "err": None},
+            {"signature": "s1", "slot": 1, "err": None},
+        ]
+        indexer._client.get_signatures_for_address = AsyncMock(return_value=signatures)
+        indexer._fetch_transactions = AsyncMock(return_value=[{}, {}, {}])
+        indexer._process_transaction = AsyncMock(side_effect=[True, False, True])
+        indexer._save_cursor = AsyncMock()
+        session = self._session(None)
+        factory = MagicMock()
+        factory.return_value.__aenter__.return_value = session
+
+        with patch("app.services.indexer.async_session_factory", factory):
+            await indexer._poll_once("token", indexer._client.program_addresses.token)
+
+        indexer._save_cursor.assert_awaited_once_with(session, "token", signatures[2])
+        session.commit.assert_awaited_once()
+        assert indexer._last_signatures["token"] == "s1"
+        assert list(indexer._processed_signatures) == ["s1", "s3"]
+
+    @pytest.mark.asyncio
+    async def test_poll_once_gives_up_after_max_attempts(self, indexer):
+        """Test that a transaction failing every attempt stops holding the cursor back"""
+        signatures = [
+            {"signature": "s2", "slot": 2, "err": None},
+            {"signature": "s1", "slot": 1, "err": None},
+        ]
+        indexer._client.get_signatures_for_address = AsyncMock(return_value=signatures)
+        indexer._fetch_transactions = AsyncMock(return_value=[{}, {}])
+        indexer._process_transaction = AsyncMock(side_effect=[False, True, False])
+        indexer._save_cursor = AsyncMock()
+        session = self._session(None)
+        factory = MagicMock()
+        factory.return_value.__aenter__.return_value = session
+
+        with patch("app.services.indexer.async_session_factory", factory), \
+                patch("app.services.indexer.MAX_TRANSACTION_ATTEMPTS", 2):
+            await indexer._poll_once("token", indexer._client.program_addresses.token)
+            indexer._save_cursor.assert_not_awaited()
+            assert indexer._failed_attempts == {"s1": 1}
+
+            await indexer._poll_once("token", indexer._client.program_addresses.token)
+
+        indexer._save_cursor.assert_awaited_once_with(session, "token", signatures[0])
+        assert indexer._last_signatures["token"] == "s2"
+        assert indexer._failed_attempts == {}
+        assert list(indexer._processed_signatures) == ["s2", "s1"]
+
+    @pytest.mark.asyncio
+    async def test_backfill_counts_only_stored_transactions(self, indexer):
+        """Test that backfill's count skips transactions that failed to process"""
+        signatures = [
+            {"signature": "s2", "slot": 2, "err": None},
+            {"signature": "s1", "slot": 1, "err": None},
+        ]
+        indexer._client.get_signatures_for_address = AsyncMock(side_effect=[signatures, []])
+        indexer._process_transaction = AsyncMock(side_effect=[True, False])
+        factory = MagicMock()
+        factory.return_value.__aenter__.return_value = self._session(None)
+
+        with patch("app.services.indexer.async_session_factory", factory):
+            assert await indexer.backfill("token") == 1
+
+        assert list(indexer._processed_signatures) == ["s2"]
+
+    def test_mark_processed_evicts_oldest(self, indexer):
+        """Test that the processed-signature LRU drops the least recently marked entries"""
+        with patch("app.services.indexer.MAX_PROCESSED_SIGNATURES", 3):
+            for signature in ("a", "b", "c", "a", "d"):
+                indexer._mark_processed(signature)
+
+        assert list(indexer._processed_signatures) == ["c", "a", "d"]
+
+    @pytest.mark.asyncio
+    async def test_process_transaction_skips_stored_signature(self, indexer):
+        """Test that an ON CONFLICT no-op counts as done without re-applying events"""
+        session = self._session(None)
+        sig_info = {"signature": "sig1", "slot": 42, "block_time": None}
+
+        assert await indexer._process_transaction(session, "token", sig_info, {"meta": {}}) is True
+        indexer.event_processor.process_transaction.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_poll_once_commits_batch_with_cursor(self, indexer):
+        """Test that a polled batch is committed once together with the cursor upsert"""
+        signatures = [
+            {"signature": "s2", "slot": 2, "err": None},
+            {"signature": "s1", "slot": 1, "err": None},
+        ]
+        indexer._client.get_signatures_for_address = AsyncMock(return_value=signatures)
+        indexer._fetch_transactions = AsyncMock(return_value=[{}, {}])
+        indexer._process_transaction = AsyncMock(return_value=True)
+        session = self._session(None)
+        factory = MagicMock()
+        factory.return_value.__aenter__.return_value = session
+
+        with patch("app.services.indexer.async_session_factory", factory):
+            await indexer._poll_once("token", indexer._client.program_addresses.token)
+
+        factory.assert_called_once()
+        assert [c.args[2]["signature"] for c in indexer._process_transaction.call_args_list] == ["s1", "s2"]
+        statement = session.execute.call_args.args[0].compile(dialect=postgresql.dialect())
+        assert "ON CONFLICT (program) DO UPDATE" in str(statement)
+        assert statement.params["last_signature"] == "s2"
+        session.commit.assert_awaited_once()
+        assert indexer._last_signatures["token"] == "s2"
+
+    @pytest.mark.asyncio
+    async def test_listen_program_wakes_and_falls_back(self, indexer):
+        """Test that log notifications set wake and a dropped websocket falls back to polling"""
+        wake = asyncio.Event()
+        woken = []
+
+        async def logs_subscribe(address):
+            assert "token" in indexer._subscribed
+            yield {"signature": "sig1"}
+            woken.append(wake.is_set())
+            wake.clear()
+            indexer._running = False
+            raise ConnectionError("closed")
+
+        indexer._client.logs_subscribe = logs_subscribe
+        indexer._running = True
+        indexer.poll_interval = 0
+
+        await indexer._listen_program("token", indexer._client.program_addresses.token, wake)
+
+        assert woken == [True]
+        assert wake.is_set()  # Catch-up poll after the drop
+        assert "token" not in indexer._subscribed
+
+
+class TestJsonSerializer:
+    """Tests for the engine's JSON/JSONB serializer"""
+
+    def test_serializes_datetimes(self):
+        """Test that datetimes are written as ISO strings"""
+        assert json_serializer({"at": datetime(2024, 1, 2, 3, 4, 5)}) == '{"at":"2024-01-02T03:04:05"}'
+
+    def test_falls_back_for_wide_integers(self):
+        """Test that integers beyond 64 bits (u128 amounts) still serialize"""
+        payload = {"amount": 2**100, "at": datetime(2024, 1, 2, 3, 4, 5)}
+        assert json_serializer(payload) == '{"amount":%d,"at":"2024-01-02T03:04:05"}' % 2**100